@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol, Optional
+from typing import AsyncIterator, Protocol, Optional
 from uuid import UUID
 
 from app.domain.models import (
@@ -25,6 +25,9 @@ class GroundTruthRepo(Protocol):
     async def list_all_gt(
         self, status: Optional[GroundTruthStatus] = None
     ) -> list[AgenticGroundTruthEntry]: ...
+    def iter_all_gt(
+        self, status: Optional[GroundTruthStatus] = None
+    ) -> AsyncIterator[AgenticGroundTruthEntry]: ...
     async def list_gt_paginated(
         self,
         status: Optional[GroundTruthStatus] = None,
@@ -60,7 +63,7 @@ class GroundTruthRepo(Protocol):
     async def query_unassigned_global(
         self, user_id: str, take: int, exclude_ids: list[str] | None = None
     ) -> list[AgenticGroundTruthEntry]: ...
-    async def assign_to(self, item_id: str, user_id: str) -> bool: ...
+    async def assign_to(self, item_id: str, user_id: str) -> AgenticGroundTruthEntry | None: ...
     async def clear_assignment(self, item_id: str) -> bool: ...
     async def list_assigned(self, user_id: str) -> list[AgenticGroundTruthEntry]: ...
 
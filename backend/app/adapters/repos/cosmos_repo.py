@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Any
+from typing import AsyncIterator, Optional, Any
 import asyncio
 from datetime import datetime, timezone
 import os
@@ -583,6 +583,12 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
     async def list_all_gt(
         self, status: Optional[GroundTruthStatus] = None
     ) -> list[AgenticGroundTruthEntry]:
+        return [item async for item in self.iter_all_gt(status)]
+
+    async def iter_all_gt(
+        self, status: Optional[GroundTruthStatus] = None
+    ) -> AsyncIterator[AgenticGroundTruthEntry]:
+        """Yield ground truth items as Cosmos returns result pages, without buffering them all."""
         await self._ensure_initialized()
         # Cross-partition scan for all GT items; exclude non-ground-truth documents (e.g. curation-instructions)
         clauses: list[str] = ["c.docType = 'ground-truth-item'"]
@@ -592,13 +598,11 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
             params.append({"name": "@status", "value": status.value})
         where = " WHERE " + " AND ".join(clauses)
         query = f"SELECT * FROM c{where}"
-        items: list[AgenticGroundTruthEntry] = []
         gt = self._gt_container
         assert gt is not None
         it = gt.query_items(query=query, parameters=params, enable_scan_in_query=True)  # type: ignore
         async for doc in it:  # type: ignore
-            items.append(self._from_doc(doc))
-        return items
+            yield self._from_doc(doc)
 
     def _build_query_filter(
         self,
@@ -1903,7 +1907,7 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
                 floors[ds] += 1
         return floors
 
-    async def assign_to(self, item_id: str, user_id: str) -> bool:
+    async def assign_to(self, item_id: str, user_id: str) -> AgenticGroundTruthEntry | None:
         """Assign an item to a user.
 
         NOTE: User ID validation should be performed by the service layer before
@@ -1915,7 +1919,8 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
             user_id: The user ID to assign to (must be alphanumeric with @, ., -, _)
 
         Returns:
-            True if assignment succeeded, False otherwise
+            The updated item as written (including its new ETag) if assignment
+            succeeded, None otherwise
         """
         await self._ensure_initialized()
 
@@ -1928,7 +1933,7 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
             self._logger.warning(
                 f"repo.assign_to.invalid_user_id - user_id={user_id}, reason=contains_invalid_characters_or_whitespace"
             )
-            return False
+            return None
 
         # Use different approaches for emulator vs production Cosmos DB
         if self.is_cosmos_emulator_in_use():
@@ -1936,7 +1941,9 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
         else:
             return await self._assign_to_with_patch(item_id, user_id)
 
-    async def _assign_to_with_patch(self, item_id: str, user_id: str) -> bool:
+    async def _assign_to_with_patch(
+        self, item_id: str, user_id: str
+    ) -> AgenticGroundTruthEntry | None:
         """Use patch operations for production Cosmos DB (optimal performance)."""
         # First, get partition key by querying for dataset and bucket
         query = "SELECT TOP 1 c.datasetName, c.bucket FROM c WHERE c.id = @id"
@@ -1955,7 +1962,7 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
 
         if not partition_info:
             self._logger.warning(f"repo.assign_to.item_not_found - item_id={item_id}")
-            return False
+            return None
 
         ds = partition_info.get("datasetName")
         bucket = partition_info.get("bucket")
@@ -1981,38 +1988,40 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
         ]
 
         try:
-            await gt.patch_item(
+            written = await gt.patch_item(
                 item=item_id,
                 partition_key=partition_key,
                 patch_operations=patch_operations,
                 filter_predicate=filter_predicate,
             )
-
-            self._logger.info(
-                f"repo.assign_to.success - item_id={item_id}, dataset={ds}, user_id={user_id}, method=patch"
-            )
-            return True
         except CosmosHttpResponseError as e:
             if getattr(e, "status_code", None) == 412:  # Precondition failed
                 self._logger.info(
                     f"repo.assign_to.assignment_rejected - item_id={item_id}, user_id={user_id}, "
                     f"reason=filter_predicate_failed"
                 )
-                return False
+                return None
             else:
                 self._logger.error(
                     f"repo.assign_to.patch_error - item_id={item_id}, user_id={user_id}, dataset={ds}, "
                     f"error_type={type(e).__name__}, error='{str(e)}', status_code={getattr(e, 'status_code', None)}"
                 )
-                return False
+                return None
         except Exception as e:
             self._logger.error(
                 f"repo.assign_to.unexpected_error - item_id={item_id}, user_id={user_id}, dataset={ds}, "
                 f"error_type={type(e).__name__}, error='{str(e)}'"
             )
-            return False
+            return None
 
-    async def _assign_to_with_read_modify_replace(self, item_id: str, user_id: str) -> bool:
+        self._logger.info(
+            f"repo.assign_to.success - item_id={item_id}, dataset={ds}, user_id={user_id}, method=patch"
+        )
+        return self._from_doc(written)
+
+    async def _assign_to_with_read_modify_replace(
+        self, item_id: str, user_id: str
+    ) -> AgenticGroundTruthEntry | None:
         """Use read-modify-replace for emulator compatibility."""
         # Select all fields to preserve complete document structure for replace_item
         query = "SELECT TOP 1 * FROM c WHERE c.id = @id"
@@ -2030,7 +2039,7 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
 
         if not doc:
             self._logger.warning(f"repo.assign_to.item_not_found - item_id={item_id}")
-            return False
+            return None
 
         ds = doc.get("datasetName")
         bucket = doc.get("bucket")
@@ -2054,7 +2063,7 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
                     f"repo.assign_to.assignment_rejected - item_id={item_id}, current_assigned_to={current_assigned_to}, "
                     f"current_status={current_status}, reason=already_assigned_to_other_user"
                 )
-                return False
+                return None
 
             # Update the item with assignment details
             now = datetime.now(timezone.utc).isoformat()
@@ -2068,22 +2077,22 @@ class CosmosGroundTruthRepo(GroundTruthRepo):
 
             # Use replace_item without etag since query result may not include it
             # The conditional logic above provides the race condition protection
-            await gt.replace_item(
+            written = await gt.replace_item(
                 item=item_id,
                 body=updated_item,
             )
-
-            self._logger.info(
-                f"repo.assign_to.success - item_id={item_id}, dataset={ds}, user_id={user_id}, method=read_modify_replace"
-            )
-            return True
         except Exception as e:
             self._logger.error(
                 f"repo.assign_to.conflict_or_error - item_id={item_id}, user_id={user_id}, dataset={ds}, "
                 f"error_type={type(e).__name__}, error='{str(e)}', status_code={getattr(e, 'status_code', None)}, "
                 f"partition_key={partition_key}, method=read_modify_replace"
             )
-            return False
+            return None
+
+        self._logger.info(
+            f"repo.assign_to.success - item_id={item_id}, dataset={ds}, user_id={user_id}, method=read_modify_replace"
+        )
+        return self._from_doc(written)
 
     async def clear_assignment(self, item_id: str) -> bool:
         """Clear assignment fields using partial update.
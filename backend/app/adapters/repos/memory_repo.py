@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from math import ceil
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 from uuid import UUID
 
 from app.domain.conversation_fields import answer_text_from_item, question_text_from_item
@@ -220,6 +220,12 @@ class InMemoryGroundTruthRepo:
             for item in self._sort_items(items, SortField.updated_at, None, SortOrder.desc)
         ]
 
+    async def iter_all_gt(
+        self, status: GroundTruthStatus | None = None
+    ) -> AsyncIterator[AgenticGroundTruthEntry]:
+        for item in await self.list_all_gt(status):
+            yield item
+
     async def list_gt_paginated(
         self,
         status: GroundTruthStatus | None = None,
@@ -378,21 +384,20 @@ class InMemoryGroundTruthRepo:
             for item in self._sort_items(items, SortField.updated_at, None, SortOrder.desc)[:take]
         ]
 
-    async def assign_to(self, item_id: str, user_id: str) -> bool:
+    async def assign_to(self, item_id: str, user_id: str) -> AgenticGroundTruthEntry | None:
         existing = self._get_stored(item_id)
         if existing is None:
-            return False
+            return None
         if (
             existing.assignedTo
             and existing.assignedTo != user_id
             and existing.status == GroundTruthStatus.draft
         ):
-            return False
+            return None
         existing.assignedTo = user_id
         existing.assigned_at = self._now()
         existing.status = GroundTruthStatus.draft
-        self._save_item(existing)
-        return True
+        return self._save_item(existing)
 
     async def clear_assignment(self, item_id: str) -> bool:
         existing = self._get_stored(item_id)
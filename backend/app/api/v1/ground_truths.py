@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import time
 
@@ -322,7 +323,9 @@ async def import_bulk(
     # Scan for PII (informational warnings only, does not block import)
     pii_warnings: list[PIIWarning] = []
     if settings.PII_DETECTION_ENABLED:
-        pii_warnings = scan_bulk_items_for_pii(items)
+        # CPU-bound regex scan over every text field; run it off the event loop so a
+        # large import does not stall other requests
+        pii_warnings = await asyncio.to_thread(scan_bulk_items_for_pii, items)
         if pii_warnings:
             logger.info(
                 f"api.import_bulk.pii_detected - items={len(items)}, warnings={len(pii_warnings)}"
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, AliasChoices, SecretStr, model_validator
+from functools import lru_cache
 from pathlib import Path
 import os
 import logging
@@ -294,6 +295,17 @@ def normalize_allocation(weights: dict[str, float]) -> dict[str, float]:
     return {k: v / total for k, v in filtered.items()}
 
 
+@lru_cache(maxsize=8)
+def _parse_sampling_allocation(raw: str) -> tuple[tuple[str, float], ...]:
+    """Parse and normalize an allocation string, ordered by descending weight.
+
+    Cached by the raw string so steady-state requests skip parsing and sorting;
+    a changed setting is simply a new cache key.
+    """
+    normalized = normalize_allocation(parse_sampling_allocation_env(raw))
+    return tuple(sorted(normalized.items(), key=lambda kv: kv[1], reverse=True))
+
+
 def get_sampling_allocation() -> dict[str, float]:
     """Read sampling allocation via Settings and return normalized weights.
 
@@ -301,14 +313,14 @@ def get_sampling_allocation() -> dict[str, float]:
     For compatibility in tests or ad-hoc runs where settings wasn't initialized with
     that value, we fall back to reading the environment directly.
     Supports only CSV form for now: "dsA:50,dsB:25,dsC:25". Returns {} if missing/invalid.
+    Keys are ordered by descending weight (ties keep configuration order).
     """
     raw = settings.SAMPLING_ALLOCATION or os.getenv("GTC_SAMPLING_ALLOCATION", "")
     if raw is not None:
         raw = raw.strip()
     if not raw:
         return {}
-    parsed = parse_sampling_allocation_env(raw)
-    return normalize_allocation(parsed)
+    return dict(_parse_sampling_allocation(raw))
 
 
 # IMPORTANT: Do not reassign `settings` again here. The instance above has
@@ -75,6 +75,10 @@ class ExclusiveGroupRule(Rule):
                 continue
             by_group.setdefault(g, []).append(v)
 
+        # Common case: every group holds a single value, so nothing can conflict
+        if all(len(values) == 1 for values in by_group.values()):
+            return errors
+
         for g, spec in schema.items():
             if not spec.exclusive:
                 continue
@@ -90,19 +94,20 @@ class DependencyRule(Rule):
     def check(self, tags: Set[str], schema: dict[str, TagGroupSpec]) -> list[str]:
         errors: list[str] = []
         present: Set[Tuple[str, str]] = set()
+        present_groups: Set[str] = set()
         for t in tags:
             try:
                 g, v = t.split(":", 1)
             except ValueError:
                 continue
             present.add((g, v))
+            present_groups.add(g)
 
         for g, spec in schema.items():
             if not spec.depends_on:
                 continue
             # if any tag from this group present, ensure dependencies present
-            any_present = any(gg == g for (gg, _vv) in present)
-            if any_present:
+            if g in present_groups:
                 for dep in spec.depends_on:
                     if dep not in present:
                         errors.append(f"Tag group '{g}' requires '{dep[0]}:{dep[1]}' to be present")
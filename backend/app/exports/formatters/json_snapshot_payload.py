@@ -24,13 +24,14 @@ class JsonSnapshotPayloadFormatter(ExportFormatter):
     def format_name(self) -> str:
         return "json_snapshot_payload"
 
-    def format(self, docs: list[dict[str, Any]]) -> str:
+    def build_payload(self, docs: list[dict[str, Any]]) -> dict[str, Any]:
+        """Return the snapshot payload as a dict, before JSON encoding."""
         dataset_names = _collect_dataset_names(docs)
         filters = dict(self._filters)
         if "status" not in filters:
             filters["status"] = "approved"
 
-        payload = {
+        return {
             "schemaVersion": "v2",
             "snapshotAt": self._snapshot_at,
             "datasetNames": dataset_names,
@@ -38,4 +39,6 @@ class JsonSnapshotPayloadFormatter(ExportFormatter):
             "filters": filters,
             "items": docs,
         }
-        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    def format(self, docs: list[dict[str, Any]]) -> str:
+        return json.dumps(self.build_payload(docs), ensure_ascii=False, separators=(",", ":"))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any, AsyncIterable, Iterable
 
 from fastapi.responses import Response
 
@@ -22,6 +22,10 @@ def _collect_dataset_names(items: Iterable[dict[str, Any]]) -> list[str]:
     return sorted(name for name in dataset_names if name)
 
 
+async def _single_batch(items: list[dict[str, Any]]) -> AsyncIterable[list[dict[str, Any]]]:
+    yield items
+
+
 class ExportPipeline:
     def __init__(self, storage: ExportStorage) -> None:
         self._storage = storage
@@ -39,23 +43,40 @@ class ExportPipeline:
         filters: dict[str, Any] | None = None,
         snapshot_at: str | None = None,
     ) -> dict[str, str | int]:
+        return await self.deliver_artifact_batches(
+            _single_batch(items), filters=filters, snapshot_at=snapshot_at
+        )
+
+    async def deliver_artifact_batches(
+        self,
+        batches: AsyncIterable[list[dict[str, Any]]],
+        filters: dict[str, Any] | None = None,
+        snapshot_at: str | None = None,
+    ) -> dict[str, str | int]:
+        """Write one artifact per item as batches arrive, then the manifest.
+
+        Only the current batch is held in memory; dataset names and the item count
+        are accumulated along the way.
+        """
         snapshot_at = snapshot_at or _default_snapshot_at()
         prefix = _snapshot_prefix(snapshot_at)
-        dataset_names = _collect_dataset_names(items)
+        dataset_names: set[str] = set()
 
         count = 0
-        for item in items:
-            item_id = str(item.get("id") or "").strip()
-            if not item_id:
-                continue
-            key = f"{prefix}/ground-truth-{item_id}.json"
-            await self._storage.write_json(key, item)
-            count += 1
+        async for items in batches:
+            dataset_names.update(_collect_dataset_names(items))
+            for item in items:
+                item_id = str(item.get("id") or "").strip()
+                if not item_id:
+                    continue
+                key = f"{prefix}/ground-truth-{item_id}.json"
+                await self._storage.write_json(key, item)
+                count += 1
 
         manifest = {
             "schemaVersion": "v2",
             "snapshotAt": snapshot_at,
-            "datasetNames": dataset_names,
+            "datasetNames": sorted(dataset_names),
             "count": count,
             "filters": filters or {"status": "approved"},
         }
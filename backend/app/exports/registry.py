@@ -59,7 +59,8 @@ class ExportProcessorRegistry:
         if not transforms:
             return docs
 
-        current_docs = [dict(doc) for doc in docs]
+        # Each transform receives a shallow copy, so the input docs are never mutated
+        current_docs = docs
         for transform in transforms:
             transform_fn = getattr(transform, "transform", transform)
             current_docs = [transform_fn(dict(doc)) for doc in current_docs]
@@ -1,42 +1,74 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 from pathlib import Path
 from typing import Any, AsyncIterator
 
 from app.exports.storage.base import ExportStorage
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Write a sibling temp file and rename it over the target so a crash mid-write
+    # never leaves a truncated artifact or manifest behind
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_json_sync(path: Path, obj: dict[str, Any]) -> None:
+    # Encode before touching the filesystem so an unserializable object writes nothing
+    data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    _write_atomic(path, data)
+
+
+def _write_bytes_sync(path: Path, data: bytes) -> None:
+    _write_atomic(path, data)
+
+
 class LocalExportStorage(ExportStorage):
+    """Export storage on the local filesystem.
+
+    Disk I/O (and JSON encoding for write_json) runs in a worker thread via
+    asyncio.to_thread so large artifact exports do not block the event loop.
+    """
+
     def __init__(self, base_dir: str | Path = ".") -> None:
         self._base_dir = Path(base_dir)
 
     async def write_json(self, key: str, obj: dict[str, Any]) -> None:
-        path = self._resolve_path(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(obj, handle, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(_write_json_sync, self._resolve_path(key), obj)
 
     async def write_bytes(self, key: str, data: bytes, content_type: str) -> None:
-        path = self._resolve_path(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as handle:
-            handle.write(data)
+        await asyncio.to_thread(_write_bytes_sync, self._resolve_path(key), data)
 
     async def open_read(self, key: str) -> AsyncIterator[bytes]:
         path = self._resolve_path(key)
 
         async def iterator() -> AsyncIterator[bytes]:
-            with path.open("rb") as handle:
+            handle = await asyncio.to_thread(path.open, "rb")
+            try:
                 while True:
-                    chunk = handle.read(1024 * 1024)
+                    chunk = await asyncio.to_thread(handle.read, 1024 * 1024)
                     if not chunk:
                         break
                     yield chunk
+            finally:
+                handle.close()
 
         return iterator()
 
     async def list_prefix(self, prefix: str) -> list[str]:
+        return await asyncio.to_thread(self._list_prefix_sync, prefix)
+
+    def _list_prefix_sync(self, prefix: str) -> list[str]:
         base = self._resolve_path(prefix)
         if not base.exists():
             return []
@@ -12,13 +12,15 @@ This module defines:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 if TYPE_CHECKING:
     from app.domain.models import AgenticGroundTruthEntry
 
+_T = TypeVar("_T")
 
 # ---------------------------------------------------------------------------
 # Supporting types for plugin-pack extension surfaces
@@ -140,6 +142,38 @@ class ComputedTagPlugin(ABC):
         pass
 
 
+# Per-evaluation memo shared by all plugins during a single compute_all() call.
+# Keyed by (id(doc), key); None when no evaluation is in progress.
+_evaluation_memo: ContextVar[dict[tuple[int, str], Any] | None] = ContextVar(
+    "computed_tag_evaluation_memo", default=None
+)
+
+
+def memoize_for_evaluation(doc: AgenticGroundTruthEntry, key: str, compute: Callable[[], _T]) -> _T:
+    """Return a per-document value shared across plugins within one compute_all() call.
+
+    Several plugins derive tags from the same expensive document feature (e.g. the
+    total reference count). Wrapping that derivation here computes it once per
+    evaluation instead of once per plugin. Outside compute_all() the value is
+    computed directly, so plugins behave identically when called on their own.
+
+    Args:
+        doc: The document the value is derived from.
+        key: Stable name for the derived value (e.g. 'rag-compat:totalReferences').
+        compute: Zero-argument callable producing the value.
+
+    Returns:
+        The cached or freshly computed value.
+    """
+    memo = _evaluation_memo.get()
+    if memo is None:
+        return compute()
+    memo_key = (id(doc), key)
+    if memo_key not in memo:
+        memo[memo_key] = compute()
+    return memo[memo_key]
+
+
 class TagPluginRegistry:
     """Registry for managing and executing computed tag plugins.
 
@@ -161,6 +195,13 @@ class TagPluginRegistry:
     def __init__(self) -> None:
         self._plugins: list[ComputedTagPlugin] = []
         self._registered_keys: set[str] = set()
+        # Bound compute methods, rebuilt on register() so compute_all() skips the
+        # per-plugin attribute lookup on every document.
+        self._compute_fns: tuple[Callable[[AgenticGroundTruthEntry], str | None], ...] = ()
+        # Static keys and dynamic prefixes, also rebuilt on register() so tag
+        # filtering does not rescan the plugin list for every tag.
+        self._static_keys: frozenset[str] = frozenset()
+        self._dynamic_prefixes: tuple[str, ...] = ()
 
     def register(self, plugin: ComputedTagPlugin) -> None:
         """Register a computed tag plugin.
@@ -177,12 +218,22 @@ class TagPluginRegistry:
             )
         self._registered_keys.add(plugin.tag_key)
         self._plugins.append(plugin)
+        self._compute_fns = tuple(p.compute for p in self._plugins)
+        if plugin.tag_key.endswith(":_dynamic"):
+            # Extract prefix: "dataset:_dynamic" -> "dataset:"
+            prefix = plugin.tag_key[: -len("_dynamic")]
+            if prefix not in self._dynamic_prefixes:
+                self._dynamic_prefixes += (prefix,)
+        else:
+            self._static_keys = self._static_keys | {plugin.tag_key}
 
     def compute_all(self, doc: AgenticGroundTruthEntry) -> list[str]:
         """Compute all applicable tags for a document.
 
         Iterates through all registered plugins and collects tags
         from plugins whose compute() method returns a tag string.
+        Values memoized via memoize_for_evaluation() are shared across
+        plugins for the duration of this call only.
 
         Args:
             doc: The AgenticGroundTruthEntry to evaluate.
@@ -190,12 +241,36 @@ class TagPluginRegistry:
         Returns:
             A list of computed tag keys that apply to this document.
         """
-        tags: list[str] = []
-        for plugin in self._plugins:
-            tag = plugin.compute(doc)
-            if tag:
-                tags.append(tag)
-        return tags
+        token = _evaluation_memo.set({})
+        try:
+            return [tag for tag in (compute(doc) for compute in self._compute_fns) if tag]
+        finally:
+            _evaluation_memo.reset(token)
+
+    def compute_all_batch(self, docs: Iterable[AgenticGroundTruthEntry]) -> list[list[str]]:
+        """Compute all applicable tags for many documents in one pass.
+
+        Equivalent to ``[self.compute_all(doc) for doc in docs]`` but sets up the
+        per-evaluation memo once for the whole batch. Plugins are pure Python and
+        hold the GIL, so documents are evaluated sequentially; thread or process
+        pools would only add scheduling and pickling overhead.
+
+        Args:
+            docs: The documents to evaluate. They must not be mutated while the
+                batch is being computed.
+
+        Returns:
+            One list of computed tag keys per document, in input order.
+        """
+        batch = list(docs)
+        compute_fns = self._compute_fns
+        token = _evaluation_memo.set({})
+        try:
+            return [
+                [tag for tag in (compute(doc) for compute in compute_fns) if tag] for doc in batch
+            ]
+        finally:
+            _evaluation_memo.reset(token)
 
     def get_all_keys(self) -> set[str]:
         """Get the set of all registered computed tag keys.
@@ -214,7 +289,7 @@ class TagPluginRegistry:
         Returns:
             A set of tag keys excluding those ending with ':_dynamic'.
         """
-        return {p.tag_key for p in self._plugins if not p.tag_key.endswith(":_dynamic")}
+        return set(self._static_keys)
 
     def get_dynamic_prefixes(self) -> set[str]:
         """Get the prefixes for dynamic computed tag plugins.
@@ -225,13 +300,7 @@ class TagPluginRegistry:
         Returns:
             A set of prefixes that identify dynamic computed tags.
         """
-        prefixes: set[str] = set()
-        for plugin in self._plugins:
-            if plugin.tag_key.endswith(":_dynamic"):
-                # Extract prefix: "dataset:_dynamic" -> "dataset:"
-                prefix = plugin.tag_key[: -len("_dynamic")]
-                prefixes.add(prefix)
-        return prefixes
+        return set(self._dynamic_prefixes)
 
     def is_computed_tag(self, tag: str, computed_tags: list[str] | None = None) -> bool:
         """Check if a tag is a computed tag (static or dynamic).
@@ -248,20 +317,12 @@ class TagPluginRegistry:
         Returns:
             True if the tag should be treated as a computed tag.
         """
-        # Check static keys
-        if tag in self.get_static_keys():
-            return True
-
-        # Check dynamic prefixes
-        for prefix in self.get_dynamic_prefixes():
-            if tag.startswith(prefix):
-                return True
-
-        # Check current computed values
-        if computed_tags and tag in computed_tags:
-            return True
-
-        return False
+        # Check static keys, then dynamic prefixes, then current computed values
+        return (
+            tag in self._static_keys
+            or tag.startswith(self._dynamic_prefixes)
+            or bool(computed_tags and tag in computed_tags)
+        )
 
     def filter_manual_tags(
         self, manual_tags: list[str] | None, computed_tags: list[str] | None = None
@@ -281,7 +342,9 @@ class TagPluginRegistry:
         if not manual_tags:
             return []
 
-        return [t for t in manual_tags if not self.is_computed_tag(t, computed_tags)]
+        excluded = self._static_keys.union(computed_tags or ())
+        prefixes = self._dynamic_prefixes
+        return [t for t in manual_tags if t not in excluded and not t.startswith(prefixes)]
 
     def __len__(self) -> int:
         """Return the number of registered plugins."""
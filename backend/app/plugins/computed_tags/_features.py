@@ -0,0 +1,97 @@
+"""Shared document features for computed tag plugins.
+
+Several plugins bucket documents on the same derived value (history length,
+total reference count, question word count). Deriving those values here and
+memoizing them per compute_all() call turns each plugin into a cheap integer
+comparison: the underlying history/reference walk runs once per document
+instead of once per plugin.
+
+This module is private (leading underscore) and is skipped by plugin discovery.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.domain.conversation_fields import question_text_from_item
+from app.plugins.base import memoize_for_evaluation
+from app.plugins.pack_registry import get_default_pack_registry
+
+if TYPE_CHECKING:
+    from app.domain.models import AgenticGroundTruthEntry
+
+TOTAL_REFERENCES_KEY = "rag-compat:totalReferences"
+
+
+def history_length(doc: AgenticGroundTruthEntry) -> int:
+    """Return the number of conversation turns in the document's history.
+
+    Args:
+        doc: The AgenticGroundTruthEntry to evaluate.
+
+    Returns:
+        The history length, or 0 when history is missing or malformed.
+    """
+
+    def _compute() -> int:
+        history = doc.history
+        return len(history) if history and isinstance(history, list) else 0
+
+    return memoize_for_evaluation(doc, "history_length", _compute)
+
+
+def reference_count(doc: AgenticGroundTruthEntry) -> int:
+    """Return the total number of references on the document.
+
+    Uses canonical reference derivation from history/plugin payloads.
+
+    Args:
+        doc: The AgenticGroundTruthEntry to evaluate.
+
+    Returns:
+        The total number of references.
+    """
+
+    def _compute() -> int:
+        count = get_default_pack_registry().plugin_sort_value(doc, TOTAL_REFERENCES_KEY)
+        return int(count) if isinstance(count, int) else 0
+
+    return memoize_for_evaluation(doc, TOTAL_REFERENCES_KEY, _compute)
+
+
+def reference_urls(doc: AgenticGroundTruthEntry) -> tuple[str, ...]:
+    """Return the non-empty reference URLs of the document.
+
+    Reads URLs straight from the plugin-owned search documents instead of
+    materializing Reference models just to read their url field.
+
+    Args:
+        doc: The AgenticGroundTruthEntry to evaluate.
+
+    Returns:
+        A tuple of reference URLs, including those attached to history turns.
+    """
+
+    def _compute() -> tuple[str, ...]:
+        candidates = get_default_pack_registry().collect_search_documents(doc)
+        return tuple(
+            url for url in (c.get("url") for c in candidates) if isinstance(url, str) and url
+        )
+
+    return memoize_for_evaluation(doc, "reference_urls", _compute)
+
+
+def question_word_count(doc: AgenticGroundTruthEntry) -> int:
+    """Return the word count of the document's question.
+
+    Uses canonical question derivation from history and .split() to count words.
+
+    Args:
+        doc: The AgenticGroundTruthEntry to evaluate.
+
+    Returns:
+        The number of words in the question.
+    """
+    return memoize_for_evaluation(
+        doc, "question_word_count", lambda: len(question_text_from_item(doc).split())
+    )
@@ -13,8 +13,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from app.domain.conversation_fields import question_text_from_item
 from app.plugins.base import ComputedTagPlugin
+from app.plugins.computed_tags._features import question_word_count
 
 if TYPE_CHECKING:
     from app.domain.models import AgenticGroundTruthEntry
@@ -26,22 +26,6 @@ MEDIUM_MAX_WORDS = (
 )
 
 
-def _get_question_word_count(doc: AgenticGroundTruthEntry) -> int:
-    """Get the word count for the document's question.
-
-    Uses canonical question derivation from history.
-    Uses .split() to count words as specified in requirements.
-
-    Args:
-        doc: The AgenticGroundTruthEntry to evaluate.
-
-    Returns:
-        The number of words in the question.
-    """
-    question = question_text_from_item(doc)
-    return len(question.split())
-
-
 class QuestionLengthLongPlugin(ComputedTagPlugin):
     """Tags documents with questions longer than MEDIUM_MAX_WORDS words.
 
@@ -53,7 +37,7 @@ class QuestionLengthLongPlugin(ComputedTagPlugin):
         return "question_length:long"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        return self.tag_key if _get_question_word_count(doc) > MEDIUM_MAX_WORDS else None
+        return self.tag_key if question_word_count(doc) > MEDIUM_MAX_WORDS else None
 
 
 class QuestionLengthMediumPlugin(ComputedTagPlugin):
@@ -67,7 +51,7 @@ class QuestionLengthMediumPlugin(ComputedTagPlugin):
         return "question_length:medium"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        count = _get_question_word_count(doc)
+        count = question_word_count(doc)
         return self.tag_key if SHORT_MAX_WORDS < count <= MEDIUM_MAX_WORDS else None
 
 
@@ -82,4 +66,4 @@ class QuestionLengthShortPlugin(ComputedTagPlugin):
         return "question_length:short"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        return self.tag_key if _get_question_word_count(doc) <= SHORT_MAX_WORDS else None
+        return self.tag_key if question_word_count(doc) <= SHORT_MAX_WORDS else None
@@ -16,14 +16,17 @@ import re
 from typing import TYPE_CHECKING
 
 from app.plugins.base import ComputedTagPlugin
-from app.plugins.pack_registry import get_default_pack_registry
+from app.plugins.computed_tags._features import reference_count, reference_urls
 
 if TYPE_CHECKING:
-    from app.domain.models import AgenticGroundTruthEntry, Reference
+    from app.domain.models import AgenticGroundTruthEntry
 
 # Pattern for article references: CS followed by digits (e.g., CS431120)
 _ARTICLE_PATTERN = re.compile(r"CS\d+", re.IGNORECASE)
 
+# Pattern for helpcenter references: '/help' anywhere in the URL (case-insensitive)
+_HELP_PATTERN = re.compile(r"/help", re.IGNORECASE)
+
 
 def _is_article_url(url: str) -> bool:
     """Check if a URL is an article reference.
@@ -50,28 +53,7 @@ def _is_helpcenter_url(url: str) -> bool:
     Returns:
         True if the URL contains '/help'.
     """
-    return "/help" in url.lower()
-
-
-def _get_all_references(doc: AgenticGroundTruthEntry) -> list[Reference]:
-    """Get all references from a document, including those in history turns.
-
-    Args:
-        doc: The AgenticGroundTruthEntry to evaluate.
-
-    Returns:
-        A list of all Reference objects from the document.
-    """
-    from app.domain.models import Reference
-
-    docs = get_default_pack_registry().collect_search_documents(doc)
-    refs: list[Reference] = []
-    for candidate in docs:
-        url = candidate.get("url")
-        if not isinstance(url, str) or not url:
-            continue
-        refs.append(Reference(url=url))
-    return refs
+    return bool(_HELP_PATTERN.search(url))
 
 
 def _has_article_reference(doc: AgenticGroundTruthEntry) -> bool:
@@ -83,8 +65,11 @@ def _has_article_reference(doc: AgenticGroundTruthEntry) -> bool:
     Returns:
         True if at least one reference URL matches the article pattern.
     """
-    refs = _get_all_references(doc)
-    return any(_is_article_url(ref.url) for ref in refs)
+    # The count is shared with the retrieval-behavior plugins; no-refs documents
+    # skip the URL walk entirely.
+    if reference_count(doc) == 0:
+        return False
+    return any(_is_article_url(url) for url in reference_urls(doc))
 
 
 def _has_helpcenter_reference(doc: AgenticGroundTruthEntry) -> bool:
@@ -96,8 +81,9 @@ def _has_helpcenter_reference(doc: AgenticGroundTruthEntry) -> bool:
     Returns:
         True if at least one reference URL contains '/help'.
     """
-    refs = _get_all_references(doc)
-    return any(_is_helpcenter_url(ref.url) for ref in refs)
+    if reference_count(doc) == 0:
+        return False
+    return any(_is_helpcenter_url(url) for url in reference_urls(doc))
 
 
 class ReferenceTypeArticlePlugin(ComputedTagPlugin):
@@ -13,27 +13,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from app.plugins.base import ComputedTagPlugin
-from app.plugins.pack_registry import get_default_pack_registry
+from app.plugins.computed_tags._features import reference_count
 
 if TYPE_CHECKING:
     from app.domain.models import AgenticGroundTruthEntry
 
 
-def _get_total_reference_count(doc: AgenticGroundTruthEntry) -> int:
-    """Get the total count of references from a document.
-
-    Uses canonical reference derivation from history/plugin payloads.
-
-    Args:
-        doc: The AgenticGroundTruthEntry to evaluate.
-
-    Returns:
-        The total number of references.
-    """
-    count = get_default_pack_registry().plugin_sort_value(doc, "rag-compat:totalReferences")
-    return int(count) if isinstance(count, int) else 0
-
-
 class RetrievalBehaviorNoRefsPlugin(ComputedTagPlugin):
     """Tags documents that have no references.
 
@@ -45,7 +30,7 @@ class RetrievalBehaviorNoRefsPlugin(ComputedTagPlugin):
         return "retrieval_behavior:no_refs"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        return self.tag_key if _get_total_reference_count(doc) == 0 else None
+        return self.tag_key if reference_count(doc) == 0 else None
 
 
 class RetrievalBehaviorSinglePlugin(ComputedTagPlugin):
@@ -59,7 +44,7 @@ class RetrievalBehaviorSinglePlugin(ComputedTagPlugin):
         return "retrieval_behavior:single"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        return self.tag_key if _get_total_reference_count(doc) == 1 else None
+        return self.tag_key if reference_count(doc) == 1 else None
 
 
 class RetrievalBehaviorTwoRefsPlugin(ComputedTagPlugin):
@@ -73,7 +58,7 @@ class RetrievalBehaviorTwoRefsPlugin(ComputedTagPlugin):
         return "retrieval_behavior:two_refs"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        return self.tag_key if _get_total_reference_count(doc) == 2 else None
+        return self.tag_key if reference_count(doc) == 2 else None
 
 
 class RetrievalBehaviorRichPlugin(ComputedTagPlugin):
@@ -87,4 +72,4 @@ class RetrievalBehaviorRichPlugin(ComputedTagPlugin):
         return "retrieval_behavior:rich"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        return self.tag_key if _get_total_reference_count(doc) >= 3 else None
+        return self.tag_key if reference_count(doc) >= 3 else None
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from app.plugins.base import ComputedTagPlugin
+from app.plugins.computed_tags._features import history_length
 
 if TYPE_CHECKING:
     from app.domain.models import AgenticGroundTruthEntry
@@ -26,10 +27,7 @@ class MultiTurnPlugin(ComputedTagPlugin):
         return "turns:multiturn"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        history = doc.history
-        if not history or not isinstance(history, list):
-            return None
-        return self.tag_key if len(history) > 2 else None
+        return self.tag_key if history_length(doc) > 2 else None
 
 
 class SingleTurnPlugin(ComputedTagPlugin):
@@ -44,7 +42,4 @@ class SingleTurnPlugin(ComputedTagPlugin):
         return "turns:singleturn"
 
     def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
-        history = doc.history
-        if not history or not isinstance(history, list):
-            return self.tag_key
-        return self.tag_key if len(history) <= 2 else None
+        return self.tag_key if history_length(doc) <= 2 else None
@@ -10,8 +10,12 @@ flattened into references during import, and new writes only persist
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
+from pydantic import TypeAdapter
+
 from app.plugins.base import ExplorerFieldDefinition, ExportTransform, ImportTransform, PluginPack
 
 if TYPE_CHECKING:
@@ -33,15 +37,19 @@ _LEGACY_KEYS_TO_DROP = (
 )
 
 
+@lru_cache(maxsize=1)
+def _reference_list_adapter() -> TypeAdapter[list[Reference]]:
+    from app.domain.models import Reference
+
+    return TypeAdapter(list[Reference])
+
+
 def _coerce_reference_list(raw_refs: Any) -> list[Any]:
     if not isinstance(raw_refs, list):
         return []
 
-    from app.domain.models import Reference
-
-    return [
-        ref if isinstance(ref, Reference) else Reference.model_validate(ref) for ref in raw_refs
-    ]
+    # One validator call for the whole list; Reference instances pass through as-is.
+    return _reference_list_adapter().validate_python(raw_refs)
 
 
 def _extract_history_refs(history: Any) -> list[Any]:
@@ -346,7 +354,14 @@ class RagCompatPack(PluginPack):
     def detach_reference(
         self, item: AgenticGroundTruthEntry, ref_url: str
     ) -> AgenticGroundTruthEntry:
-        remaining = [r for r in self.refs_from_item(item) if getattr(r, "url", None) != ref_url]
+        return self.detach_references(item, (ref_url,))
+
+    def detach_references(
+        self, item: AgenticGroundTruthEntry, ref_urls: Iterable[str]
+    ) -> AgenticGroundTruthEntry:
+        """Remove every reference whose URL is in ``ref_urls`` in a single pass."""
+        targets = set(ref_urls)
+        remaining = [r for r in self.refs_from_item(item) if getattr(r, "url", None) not in targets]
         return self.replace_references(item, remaining)
 
     def get_explorer_fields(self) -> list[ExplorerFieldDefinition]:
@@ -20,7 +20,8 @@ def _discover_plugins() -> list[type[ComputedTagPlugin]]:
     """Discover all ComputedTagPlugin subclasses in the computed_tags package.
 
     Scans all modules in the computed_tags package directory and finds
-    concrete classes that inherit from ComputedTagPlugin.
+    concrete classes that inherit from ComputedTagPlugin. Classes are returned
+    in module definition order.
 
     Returns:
         A list of plugin classes (not instances).
@@ -30,18 +31,22 @@ def _discover_plugins() -> list[type[ComputedTagPlugin]]:
 
     # Iterate through all Python modules in the package directory
     for module_info in pkgutil.iter_modules([str(package_dir)]):
-        # Skip __init__ module
-        if module_info.name == "__init__":
+        # Skip __init__ and private helper modules (e.g. _features)
+        if module_info.name.startswith("_"):
             continue
 
         # Import the module
         module = importlib.import_module(f"app.plugins.computed_tags.{module_info.name}")
 
-        # Find all classes in the module that are subclasses of ComputedTagPlugin
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        # Find concrete ComputedTagPlugin subclasses defined in this module.
+        # Iterating the module namespace directly avoids inspect.getmembers()'s sorted
+        # dir() walk; the __module__ check skips plugin classes imported from elsewhere.
+        for obj in vars(module).values():
             if (
-                issubclass(obj, ComputedTagPlugin)
+                isinstance(obj, type)
+                and issubclass(obj, ComputedTagPlugin)
                 and obj is not ComputedTagPlugin
+                and obj.__module__ == module.__name__
                 and not inspect.isabstract(obj)
             ):
                 plugins.append(obj)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import re
 from app.adapters.repos.base import GroundTruthRepo
 from app.domain.models import AgenticGroundTruthEntry, AssignmentDocument
@@ -7,18 +9,81 @@ from app.plugins import get_default_registry
 from app.core.errors import AssignmentConflictError
 from app.core.config import get_sampling_allocation
 from uuid import UUID
+from collections import deque
+from collections.abc import Collection
 import random
 import logging
 import randomname  # type: ignore
+from functools import lru_cache
+from typing import Any
 from datetime import datetime, timezone
 from app.domain.enums import GroundTruthStatus
 
-
 logger = logging.getLogger(__name__)
 
 # Regex pattern for valid user IDs (alphanumeric, @, ., -, _)
-# Used to prevent SQL injection in user_id values
-USER_ID_PATTERN = re.compile(r"^[a-zA-Z0-9@.\-_]+$")
+# Used to prevent SQL injection in user_id values. Applied with fullmatch(): unlike
+# match() with a "$" anchor it cannot accept a trailing newline.
+USER_ID_PATTERN = re.compile(r"[a-zA-Z0-9@.\-_]+", re.ASCII)
+
+
+@lru_cache(maxsize=1)
+def _name_word_lists() -> tuple[list[str], list[str]]:
+    """Resolve randomname's default adjective/noun word lists once per process.
+
+    randomname.get_name() re-resolves (and re-reads) its word lists on every call,
+    which dominates bulk duplication. The lists are immutable, so load them once.
+    """
+    from randomname import util as randomname_util  # type: ignore
+
+    adjectives = randomname_util.get_groups_list(
+        randomname_util.prefix("a", randomname_util.ADJECTIVES)
+    )
+    nouns = randomname_util.get_groups_list(randomname_util.prefix("n", randomname_util.NOUNS))
+    return adjectives, nouns
+
+
+def _generate_item_id() -> str:
+    """Generate a two-word, hyphenated item id (e.g. 'sleek-voxel').
+
+    Produces the same shape as randomname.get_name() without per-call word list lookups.
+    Falls back to randomname.get_name() if the word lists cannot be resolved.
+    """
+    try:
+        adjectives, nouns = _name_word_lists()
+    except Exception:  # pragma: no cover - defensive against randomname internals changing
+        return randomname.get_name()
+    return f"{random.choice(adjectives)}-{random.choice(nouns)}".replace(" ", "-")
+
+
+@lru_cache(maxsize=256)
+def _allocate_quotas(weights: tuple[tuple[str, float], ...], k: int) -> tuple[tuple[str, int], ...]:
+    """Largest-remainder allocation core for AssignmentService.compute_quotas (k > 0)."""
+    # Normalize weights just in case
+    total = sum(w for _ds, w in weights if w > 0)
+    if total <= 0:
+        return tuple((ds, 0) for ds, _w in weights)
+    # Normalize, floor allocations and track remainders in a single pass
+    floors: dict[str, int] = {}
+    remainders: list[tuple[str, float]] = []
+    allocated = 0
+    for ds, w in weights:
+        if w <= 0:
+            continue
+        raw = (w / total) * k
+        fl = int(raw)
+        floors[ds] = fl
+        allocated += fl
+        remainders.append((ds, raw - fl))
+    remaining = max(0, k - allocated)
+    if remaining > 0:
+        # Distribute remaining to largest remainders (remainder desc, then name desc).
+        # Only the top `remaining` entries are needed, so avoid a full sort.
+        largest = heapq.nlargest(remaining, remainders, key=lambda t: (t[1], t[0]))
+        for i in range(remaining):
+            ds = largest[i % len(largest)][0]
+            floors[ds] += 1
+    return tuple(floors.items())
 
 
 class AssignmentService:
@@ -45,6 +110,17 @@ class AssignmentService:
             context["dataset"] = dataset
         return context
 
+    def _debug(
+        self,
+        event: str,
+        item_id: str | None = None,
+        dataset: str | None = None,
+        **fields: Any,
+    ) -> None:
+        """Emit a debug event, building its extra context only if DEBUG is enabled."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(event, extra={**self._log_context(item_id, dataset), **fields})
+
     @staticmethod
     def validate_user_id(user_id: str) -> bool:
         """Validate user_id format for safe use in database queries.
@@ -54,7 +130,7 @@ class AssignmentService:
         """
         if not user_id:
             return False
-        return bool(USER_ID_PATTERN.match(user_id))
+        return USER_ID_PATTERN.fullmatch(user_id) is not None
 
     @staticmethod
     def compute_quotas(weights: dict[str, float], k: int) -> dict[str, int]:
@@ -72,29 +148,24 @@ class AssignmentService:
         """
         if k <= 0 or not weights:
             return {ds: 0 for ds in weights}
-        # Normalize weights just in case
-        total = sum(w for w in weights.values() if w > 0)
-        if total <= 0:
-            return {ds: 0 for ds in weights}
-        normalized = {ds: (w / total) for ds, w in weights.items() if w > 0}
-        # Floor allocations and track remainders
-        floors: dict[str, int] = {}
-        remainders: list[tuple[str, float]] = []
-        allocated = 0
-        for ds, w in normalized.items():
-            raw = w * k
-            fl = int(raw // 1)
-            floors[ds] = fl
-            allocated += fl
-            remainders.append((ds, raw - fl))
-        remaining = max(0, k - allocated)
-        if remaining > 0:
-            # Distribute remaining to largest remainders; stable sort by remainder desc then name
-            remainders.sort(key=lambda t: (t[1], t[0]), reverse=True)
-            for i in range(remaining):
-                ds = remainders[i % len(remainders)][0]
-                floors[ds] += 1
-        return floors
+        # Allocation weights come from config and rarely change, so repeated
+        # (weights, k) pairs reuse the memoized allocation.
+        return dict(_allocate_quotas(tuple(weights.items()), k))
+
+    @staticmethod
+    def _sample_unseen(
+        candidates: list[AgenticGroundTruthEntry], seen_ids: set[str], need: int
+    ) -> list[AgenticGroundTruthEntry]:
+        """Pick up to `need` candidates not in seen_ids, in random order.
+
+        random.sample() stops after `need` picks, whereas shuffling the whole
+        candidate list randomizes items that are never consumed.
+        """
+        if need <= 0:
+            return []
+        # Drop already-seen items and collapse duplicate ids before sampling
+        unseen = list({it.id: it for it in candidates if it.id not in seen_ids}.values())
+        return random.sample(unseen, min(len(unseen), need))
 
     def can_assign_item(
         self,
@@ -138,7 +209,7 @@ class AssignmentService:
         return await self.repo.list_assigned(user_id)
 
     async def sample_candidates(
-        self, user_id: str, limit: int, exclude_ids: list[str] | None = None
+        self, user_id: str, limit: int, exclude_ids: Collection[str] | None = None
     ) -> list[AgenticGroundTruthEntry]:
         """Sample unassigned items with weighted allocation across datasets.
 
@@ -151,7 +222,8 @@ class AssignmentService:
         Args:
             user_id: The user requesting candidates
             limit: Maximum number of items to return
-            exclude_ids: Item IDs to exclude from sampling
+            exclude_ids: Item IDs to exclude from sampling (a set is merged without
+                an intermediate copy)
 
         Returns:
             List of candidate items up to limit
@@ -164,26 +236,26 @@ class AssignmentService:
             return []
 
         # 1) Include already assigned items first
-        logger.debug(
+        self._debug(
             "service.sample_candidates.start",
-            extra={
-                "limit": limit,
-                "exclude_count": len(exclude_ids) if exclude_ids else 0,
-            },
+            limit=limit,
+            exclude_count=len(exclude_ids) if exclude_ids else 0,
         )
         results: list[AgenticGroundTruthEntry] = await self.repo.list_assigned(user_id)
         seen_ids: set[str] = {it.id for it in results}
-        # Add caller-provided excludes
+        # Add caller-provided excludes; set.update takes the set-to-set fast path when
+        # the caller already holds a set
         if exclude_ids:
             seen_ids.update(exclude_ids)
-        logger.debug(
-            "service.sample_candidates.already_assigned",
-            extra={"count": len(results)},
-        )
+        # Ordered mirror of seen_ids handed to repo queries. It is extended in place as
+        # items are selected instead of being rebuilt from the set before every query.
+        exclude_list: list[str] = list(seen_ids)
+        self._debug("service.sample_candidates.already_assigned", count=len(results))
         if len(results) >= limit:
-            logger.debug(
+            self._debug(
                 "service.sample_candidates.already_assigned_satisfies",
-                extra={"count": len(results), "limit": limit},
+                count=len(results),
+                limit=limit,
             )
             return results[:limit]
 
@@ -191,95 +263,91 @@ class AssignmentService:
 
         # 2) Read allocation config
         weights = get_sampling_allocation()
-        logger.debug(
-            "service.sample_candidates.weights_config",
-            extra={"weights": weights, "has_weights": bool(weights)},
+        self._debug(
+            "service.sample_candidates.weights_config", weights=weights, has_weights=bool(weights)
         )
         if not weights:
             # No allocation configured -> simple global fill of unassigned/skipped
-            logger.debug(
-                "service.sample_candidates.no_weights_global_query",
-                extra={"remaining": remaining},
+            self._debug("service.sample_candidates.no_weights_global_query", remaining=remaining)
+            await self._global_fill(
+                user_id,
+                remaining,
+                results,
+                seen_ids,
+                exclude_list,
+                event="service.sample_candidates.global_fill",
             )
-            more = await self.repo.query_unassigned_global(
-                user_id, remaining, exclude_ids=list(seen_ids)
-            )
-            logger.debug(
-                "service.sample_candidates.global_fill",
-                extra={"remaining": remaining, "candidates": len(more)},
-            )
-            # Shuffle to reduce any cross-partition bias from Cosmos
-            random.shuffle(more)
-            for it in more:
-                if it.id not in seen_ids:
-                    results.append(it)
-                    seen_ids.add(it.id)
-                    if len(results) >= limit:
-                        break
-            logger.debug(
+            self._debug(
                 "service.sample_candidates.global_fill_complete",
-                extra={"final_count": len(results), "limit": limit},
+                final_count=len(results),
+                limit=limit,
             )
             return results[:limit]
 
         # 3) Compute quotas using largest remainder method
         quotas = self.compute_quotas(weights, remaining)
-        logger.debug(
-            "service.sample_candidates.quotas",
-            extra={"remaining": remaining, "quotas": quotas},
-        )
+        self._debug("service.sample_candidates.quotas", remaining=remaining, quotas=quotas)
 
-        # 4) Query each dataset up to its quota (single pass)
-        per_dataset_results: dict[str, list[AgenticGroundTruthEntry]] = {}
+        # 4) Query each dataset up to its quota (single pass). The queries are
+        # independent, so issue them concurrently against one exclude snapshot.
+        # Buckets are deques so the round-robin below can pop from the front in O(1)
+        per_dataset_results: dict[str, deque[AgenticGroundTruthEntry]] = {}
+        active_quotas: list[tuple[str, int]] = []
         for ds, q in quotas.items():
             if q <= 0:
-                logger.debug(
-                    "service.sample_candidates.skip_zero_quota",
-                    extra={"dataset": ds, "quota": q},
-                )
+                self._debug("service.sample_candidates.skip_zero_quota", dataset=ds, quota=q)
                 continue
-            items = await self.repo.query_unassigned_by_dataset_prefix(
-                ds, user_id, q, exclude_ids=list(seen_ids)
+            active_quotas.append((ds, q))
+        dataset_items = await asyncio.gather(
+            *(
+                self.repo.query_unassigned_by_dataset_prefix(
+                    ds, user_id, q, exclude_ids=exclude_list
+                )
+                for ds, q in active_quotas
             )
-            logger.debug(
+        )
+        for (ds, q), items in zip(active_quotas, dataset_items):
+            self._debug(
                 "service.sample_candidates.dataset_candidates",
-                extra={"dataset": ds, "quota": q, "candidates": len(items)},
+                dataset=ds,
+                quota=q,
+                candidates=len(items),
             )
             # Shuffle each bucket to de-bias ordering
             random.shuffle(items)
-            per_dataset_results[ds] = items
+            per_dataset_results[ds] = deque(items)
 
         # 5) Round-robin interleave by weight order until limit reached or supply exhausted
-        order = [ds for ds, _w in sorted(weights.items(), key=lambda kv: kv[1], reverse=True)]
+        order = sorted(weights, key=weights.__getitem__, reverse=True)
         to_take = limit - len(results)
-        logger.debug(
-            "service.sample_candidates.round_robin_start",
-            extra={"to_take": to_take, "dataset_order": order},
+        self._debug(
+            "service.sample_candidates.round_robin_start", to_take=to_take, dataset_order=order
         )
         while to_take > 0:
             progressed = False
             for ds in order:
                 if to_take <= 0:
                     break
-                lst = per_dataset_results.get(ds, [])
+                lst = per_dataset_results.get(ds)
                 while lst and lst[0].id in seen_ids:
-                    lst.pop(0)
+                    lst.popleft()
                 if lst:
-                    it = lst.pop(0)
+                    it = lst.popleft()
                     results.append(it)
                     seen_ids.add(it.id)
+                    exclude_list.append(it.id)
                     to_take -= 1
                     progressed = True
             if not progressed:
-                logger.debug(
+                self._debug(
                     "service.sample_candidates.round_robin_exhausted",
-                    extra={"collected": len(results), "limit": limit},
+                    collected=len(results),
+                    limit=limit,
                 )
                 break
 
-        logger.debug(
-            "service.sample_candidates.round_robin_complete",
-            extra={"collected": len(results), "limit": limit},
+        self._debug(
+            "service.sample_candidates.round_robin_complete", collected=len(results), limit=limit
         )
         if len(results) >= limit:
             return results[:limit]
@@ -287,38 +355,49 @@ class AssignmentService:
         # 6) Final global fill if still short (single pass)
         remaining_needed = max(0, limit - len(results))
         if remaining_needed > 0:
-            logger.debug(
+            self._debug(
                 "service.sample_candidates.global_fill_tail_start",
-                extra={"remaining_needed": remaining_needed},
-            )
-            more = await self.repo.query_unassigned_global(
-                user_id, remaining_needed, exclude_ids=list(seen_ids)
+                remaining_needed=remaining_needed,
             )
-            logger.debug(
-                "service.sample_candidates.global_fill_tail",
-                extra={"remaining": remaining_needed, "candidates": len(more)},
+            await self._global_fill(
+                user_id,
+                remaining_needed,
+                results,
+                seen_ids,
+                exclude_list,
+                event="service.sample_candidates.global_fill_tail",
             )
-            random.shuffle(more)
-            for it in more:
-                if it.id not in seen_ids:
-                    results.append(it)
-                    seen_ids.add(it.id)
-                    if len(results) >= limit:
-                        break
 
         final = results[:limit]
-        logger.debug(
-            "service.sample_candidates.done",
-            extra={"limit": limit, "return_count": len(final)},
-        )
+        self._debug("service.sample_candidates.done", limit=limit, return_count=len(final))
         return final
 
+    async def _global_fill(
+        self,
+        user_id: str,
+        need: int,
+        results: list[AgenticGroundTruthEntry],
+        seen_ids: set[str],
+        exclude_list: list[str],
+        *,
+        event: str,
+    ) -> None:
+        """Top up results with up to `need` unseen items from the global unassigned pool.
+
+        Shared by the unweighted path and the weighted path's tail fill. Mutates
+        results, seen_ids and exclude_list in place.
+        """
+        more = await self.repo.query_unassigned_global(user_id, need, exclude_ids=exclude_list)
+        self._debug(event, remaining=need, candidates=len(more))
+        # Randomize to reduce any cross-partition bias from Cosmos
+        for it in self._sample_unseen(more, seen_ids, need):
+            results.append(it)
+            seen_ids.add(it.id)
+            exclude_list.append(it.id)
+
     async def self_assign(self, user_id: str, limit: int) -> list[AgenticGroundTruthEntry]:
         if limit <= 0:
-            logger.debug(
-                "self_assign.skip_non_positive_limit",
-                extra={**self._log_context(), "limit": limit},
-            )
+            self._debug("self_assign.skip_non_positive_limit", limit=limit)
             return []
 
         assigned_docs: list[AssignmentDocument] = []
@@ -330,97 +409,87 @@ class AssignmentService:
                 return
             # Shuffle to de-bias any ordering from Cosmos queries
             random.shuffle(candidates)
-            logger.debug(
+            # Resolve the INFO level check once per batch so per-candidate log context
+            # dicts are only built when the record will actually be emitted; debug events
+            # go through self._debug, which does the same gating.
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            self._debug(
                 "self_assign.try_assign_batch",
-                extra={
-                    **self._log_context(),
-                    "remaining": remaining,
-                    "candidate_count": len(candidates),
-                },
+                remaining=remaining,
+                candidate_count=len(candidates),
             )
+            # Ordered batch of existing assignment docs and items whose docs still need
+            # writing; the doc upserts are independent and are issued concurrently below.
+            batch: list[AssignmentDocument | AgenticGroundTruthEntry] = []
             for it in candidates:
                 if it.id in seen_ids:
-                    logger.debug(
-                        "self_assign.skip_seen",
-                        extra=self._log_context(it.id, it.datasetName),
-                    )
+                    self._debug("self_assign.skip_seen", it.id, it.datasetName)
                     continue
                 seen_ids.add(it.id)
 
                 # Attempt assignment - the repo layer enforces conditional logic
                 # to prevent assigning items that are already assigned to other users
-                success = await self.repo.assign_to(it.id, user_id)
-                if success:
-                    logger.info(
-                        "self_assign.assigned",
-                        extra=self._log_context(it.id, it.datasetName),
-                    )
-                    ad = await self.repo.upsert_assignment_doc(user_id, it)
-                    assigned_docs.append(ad)
+                if await self.repo.assign_to(it.id, user_id):
+                    if info_enabled:
+                        logger.info(
+                            "self_assign.assigned",
+                            extra=self._log_context(it.id, it.datasetName),
+                        )
+                    batch.append(it)
                 else:
                     # If assignment already exists, include it
                     existing = await self.repo.get_assignment_by_gt(user_id, it.id)
                     if existing:
-                        logger.debug(
-                            "self_assign.already_assigned_doc",
-                            extra=self._log_context(it.id, it.datasetName),
-                        )
-                        assigned_docs.append(existing)
+                        self._debug("self_assign.already_assigned_doc", it.id, it.datasetName)
+                        batch.append(existing)
                     # If the item is already assigned to this user but no assignment doc exists yet,
                     # create it to keep the assignment view consistent.
-                    elif getattr(it, "assignedTo", None) == user_id:
+                    elif it.assignedTo == user_id:
                         logger.warning(
                             "self_assign.backfill_assignment_doc",
                             extra=self._log_context(it.id, it.datasetName),
                         )
-                        ad = await self.repo.upsert_assignment_doc(user_id, it)
-                        assigned_docs.append(ad)
-                if len(assigned_docs) >= limit:
-                    logger.debug(
-                        "self_assign.reached_limit",
-                        extra={**self._log_context(), "limit": limit},
-                    )
+                        batch.append(it)
+                if len(assigned_docs) + len(batch) >= limit:
+                    self._debug("self_assign.reached_limit", limit=limit)
                     break
 
+            pending = [e for e in batch if isinstance(e, AgenticGroundTruthEntry)]
+            upserted = iter(
+                await asyncio.gather(
+                    *(self.repo.upsert_assignment_doc(user_id, it) for it in pending)
+                )
+            )
+            assigned_docs.extend(
+                next(upserted) if isinstance(e, AgenticGroundTruthEntry) else e for e in batch
+            )
+
         # First pass - use sample_candidates which includes weighted allocation logic
         logger.info("self_assign.start", extra={**self._log_context(), "limit": limit})
         initial = await self.sample_candidates(user_id=user_id, limit=limit)
-        logger.debug(
-            "self_assign.initial_candidates",
-            extra={**self._log_context(), "count": len(initial)},
-        )
+        self._debug("self_assign.initial_candidates", count=len(initial))
         await _try_assign(initial, limit)
 
         # Single retry if we still need more - exclude items we've already tried
         if len(assigned_docs) < limit:
             remaining = limit - len(assigned_docs)
-            logger.debug(
-                "self_assign.retry_excluding_seen",
-                extra={
-                    **self._log_context(),
-                    "remaining": remaining,
-                    "seen_count": len(seen_ids),
-                },
+            self._debug(
+                "self_assign.retry_excluding_seen", remaining=remaining, seen_count=len(seen_ids)
             )
             retry = await self.sample_candidates(
-                user_id=user_id, limit=remaining, exclude_ids=list(seen_ids)
-            )
-            logger.debug(
-                "self_assign.retry_candidates",
-                extra={
-                    **self._log_context(),
-                    "remaining": remaining,
-                    "count": len(retry),
-                },
+                user_id=user_id, limit=remaining, exclude_ids=seen_ids
             )
+            self._debug("self_assign.retry_candidates", remaining=remaining, count=len(retry))
             await _try_assign(retry, remaining)
 
         # Return the underlying ground truth items in the order they were added
-        ground_truth_items: list[AgenticGroundTruthEntry] = []
-        for ad in assigned_docs[:limit]:
-            gt = await self.repo.get_gt(ad.datasetName, ad.bucket, ad.ground_truth_id)
-            if gt:
-                ground_truth_items.append(gt)
+        gts = await asyncio.gather(
+            *(
+                self.repo.get_gt(ad.datasetName, ad.bucket, ad.ground_truth_id)
+                for ad in assigned_docs[:limit]
+            )
+        )
+        ground_truth_items: list[AgenticGroundTruthEntry] = [gt for gt in gts if gt]
         logger.info(
             "self_assign.done",
             extra={
@@ -492,7 +561,11 @@ class AssignmentService:
         item = await self.repo.get_gt(dataset, bucket, item_id)
         if not item:
             logger.error(
-                f"assignment_service.assign_single_item.item_not_found - dataset={dataset}, bucket={bucket}, item_id={item_id}"
+                "assignment_service.assign_single_item.item_not_found - dataset=%s, bucket=%s, "
+                "item_id=%s",
+                dataset,
+                bucket,
+                item_id,
             )
             raise ValueError("Item not found")
 
@@ -509,8 +582,13 @@ class AssignmentService:
             if not force:
                 # Normal assignment blocked by existing assignment
                 logger.warning(
-                    f"assignment_service.assign_single_item.already_assigned - dataset={dataset}, bucket={bucket}, item_id={item_id}, "
-                    f"current_assigned_to={item.assignedTo}, current_status={item.status.value}"
+                    "assignment_service.assign_single_item.already_assigned - dataset=%s, "
+                    "bucket=%s, item_id=%s, current_assigned_to=%s, current_status=%s",
+                    dataset,
+                    bucket,
+                    item_id,
+                    item.assignedTo,
+                    item.status.value,
                 )
                 raise AssignmentConflictError(
                     "Item is already assigned to another user",
@@ -522,8 +600,12 @@ class AssignmentService:
             roles = user_roles or []
             if not self._has_takeover_permission(roles):
                 logger.warning(
-                    f"assignment_service.assign_single_item.force_denied - dataset={dataset}, bucket={bucket}, item_id={item_id}, "
-                    f"roles={roles}"
+                    "assignment_service.assign_single_item.force_denied - dataset=%s, bucket=%s, "
+                    "item_id=%s, roles=%s",
+                    dataset,
+                    bucket,
+                    item_id,
+                    roles,
                 )
                 raise PermissionError("Force assignment requires admin or team-lead role")
 
@@ -535,31 +617,50 @@ class AssignmentService:
             success = await self.repo.clear_assignment(item_id)
             if not success:
                 logger.error(
-                    f"assignment_service.assign_single_item.clear_assignment_failed - dataset={dataset}, bucket={bucket}, item_id={item_id}"
+                    "assignment_service.assign_single_item.clear_assignment_failed - dataset=%s, "
+                    "bucket=%s, item_id=%s",
+                    dataset,
+                    bucket,
+                    item_id,
                 )
                 raise ValueError("Failed to clear assignment for force takeover")
 
             logger.info(
-                f"assignment_service.assign_single_item.force_takeover - dataset={dataset}, bucket={bucket}, item_id={item_id}, "
-                f"from={previous_assignee}, to={user_id}"
+                "assignment_service.assign_single_item.force_takeover - dataset=%s, bucket=%s, "
+                "item_id=%s, from=%s, to=%s",
+                dataset,
+                bucket,
+                item_id,
+                previous_assignee,
+                user_id,
             )
 
         # Assign to user (will set status to draft regardless of previous state)
-        success = await self.repo.assign_to(item_id, user_id)
+        # assign_to returns the item as written, so no re-read is needed to surface
+        # the new assignment fields and ETag to the caller
+        updated = await self.repo.assign_to(item_id, user_id)
 
-        if not success:
+        if not updated:
             # Item may have been deleted or other error occurred
             logger.error(
-                f"assignment_service.assign_single_item.assignment_failed - dataset={dataset}, bucket={bucket}, item_id={item_id}"
+                "assignment_service.assign_single_item.assignment_failed - dataset=%s, bucket=%s, "
+                "item_id=%s",
+                dataset,
+                bucket,
+                item_id,
             )
             raise ValueError("Item could not be assigned")
 
         # Create assignment document for materialized view
         logger.info(
-            f"assignment_service.assign_single_item.creating_assignment_doc - dataset={dataset}, bucket={bucket}, item_id={item_id}"
+            "assignment_service.assign_single_item.creating_assignment_doc - dataset=%s, "
+            "bucket=%s, item_id=%s",
+            dataset,
+            bucket,
+            item_id,
         )
 
-        await self.repo.upsert_assignment_doc(user_id, item)
+        await self.repo.upsert_assignment_doc(user_id, updated)
 
         # Clean up previous assignment document if this was a force takeover
         if previous_assignee:
@@ -572,30 +673,35 @@ class AssignmentService:
                 )
                 if deleted:
                     logger.info(
-                        f"assignment_service.assign_single_item.previous_assignment_cleaned - "
-                        f"dataset={dataset}, bucket={bucket}, item_id={item_id}, previous_assignee={previous_assignee}"
+                        "assignment_service.assign_single_item.previous_assignment_cleaned - "
+                        "dataset=%s, bucket=%s, item_id=%s, previous_assignee=%s",
+                        dataset,
+                        bucket,
+                        item_id,
+                        previous_assignee,
                     )
                 else:
                     logger.warning(
-                        f"assignment_service.assign_single_item.previous_assignment_not_found - "
-                        f"dataset={dataset}, bucket={bucket}, item_id={item_id}, previous_assignee={previous_assignee}"
+                        "assignment_service.assign_single_item.previous_assignment_not_found - "
+                        "dataset=%s, bucket=%s, item_id=%s, previous_assignee=%s",
+                        dataset,
+                        bucket,
+                        item_id,
+                        previous_assignee,
                     )
             except Exception as e:
                 # Log error but don't fail the request - the assignment itself succeeded
                 logger.error(
-                    f"assignment_service.assign_single_item.cleanup_failed - "
-                    f"dataset={dataset}, bucket={bucket}, item_id={item_id}, previous_assignee={previous_assignee}, "
-                    f"error_type={type(e).__name__}, error={str(e)}"
+                    "assignment_service.assign_single_item.cleanup_failed - dataset=%s, "
+                    "bucket=%s, item_id=%s, previous_assignee=%s, error_type=%s, error=%s",
+                    dataset,
+                    bucket,
+                    item_id,
+                    previous_assignee,
+                    type(e).__name__,
+                    e,
                 )
 
-        # Fetch and return the updated item
-        updated = await self.repo.get_gt(dataset, bucket, item_id)
-        if not updated:
-            logger.error(
-                f"assignment_service.assign_single_item.item_not_found_after_assignment - dataset={dataset}, bucket={bucket}, item_id={item_id}"
-            )
-            raise ValueError("Item not found after assignment")
-
         return updated
 
     async def duplicate_item(
@@ -605,7 +711,7 @@ class AssignmentService:
 
         Rules:
         - Keep datasetName and bucket identical to the original
-        - Generate a new id (uuid4 string)
+        - Generate a new two-word id (randomname style, e.g. 'sleek-voxel')
         - Copy tags, comment, history, plugin references, and provenance fields
         - Ensure the `rephrase:{original.id}` tag is present exactly once
         - Set status=draft; clear reviewed_at and updatedBy
@@ -614,15 +720,14 @@ class AssignmentService:
         """
         # Build new tags with rephrase reference
         rephrase_tag = f"rephrase:{original.id}"
-        new_tags = list(original.manual_tags or [])
-        if rephrase_tag not in new_tags:
-            new_tags.append(rephrase_tag)
+        orig_tags = original.manual_tags or []
+        new_tags = list(orig_tags) if rephrase_tag in orig_tags else [*orig_tags, rephrase_tag]
 
         now = datetime.now(timezone.utc)
         new_item = AgenticGroundTruthEntry.model_validate(
             original.model_dump(by_alias=True, exclude_computed_fields=True)
         )
-        new_item.id = randomname.get_name()
+        new_item.id = _generate_item_id()
         new_item.status = GroundTruthStatus.draft
         new_item.manual_tags = new_tags
         new_item.assignedTo = user_id
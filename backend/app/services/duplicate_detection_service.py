@@ -13,8 +13,7 @@ Detection strategy:
 from __future__ import annotations
 
 import json
-import re
-from typing import Sequence
+from typing import NamedTuple, Sequence
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -44,13 +43,21 @@ class DuplicateWarning(BaseModel):
     )
 
 
+class _ItemSignature(NamedTuple):
+    """Normalized comparison keys for one item, computed once per detection run."""
+
+    question: str
+    answer: str
+    history: str
+    generic: str
+
+
 def _normalize_text(text: str | None) -> str:
     """Normalize text for comparison by removing extra whitespace and lowercasing."""
     if not text:
         return ""
-    # Replace multiple whitespace with single space, strip, lowercase
-    normalized = re.sub(r"\s+", " ", text.strip().lower())
-    return normalized
+    # str.split() with no separator strips and collapses the same whitespace as \s+
+    return " ".join(text.lower().split())
 
 
 def _get_question_text(item: AgenticGroundTruthEntry) -> str:
@@ -119,79 +126,129 @@ def _generic_signature(item: AgenticGroundTruthEntry) -> str:
     return _normalize_text(_serialize_generic_value(structured_payload))
 
 
-def _items_are_duplicates(
-    draft: AgenticGroundTruthEntry, approved: AgenticGroundTruthEntry
-) -> tuple[bool, str]:
-    """Check if two items are likely duplicates.
+def _item_signature(
+    item: AgenticGroundTruthEntry, question_text: str | None = None
+) -> _ItemSignature:
+    if question_text is None:
+        question_text = _get_question_text(item)
+    return _ItemSignature(
+        question=_normalize_text(question_text),
+        answer=_normalize_text(answer_text_from_item(item)),
+        history=_history_signature(item),
+        generic=_generic_signature(item),
+    )
 
-    Returns:
-        (is_duplicate, match_reason) tuple
-    """
-    draft_question = _normalize_text(_get_question_text(draft))
-    approved_question = _normalize_text(_get_question_text(approved))
 
+def _signatures_match(draft: _ItemSignature, approved: _ItemSignature) -> tuple[bool, str]:
+    """Compare precomputed signatures; see _items_are_duplicates for the rules."""
     # Check for exact question match when both items expose question text
-    if draft_question and approved_question and draft_question == approved_question:
+    if draft.question and approved.question and draft.question == approved.question:
         # Also check answer for stronger signal
-        draft_answer = _normalize_text(answer_text_from_item(draft))
-        approved_answer = _normalize_text(answer_text_from_item(approved))
-
-        if draft_answer and approved_answer and draft_answer == approved_answer:
+        if draft.answer and approved.answer and draft.answer == approved.answer:
             return (True, "exact question and answer match")
         return (True, "exact question match")
 
-    draft_history = _history_signature(draft)
-    approved_history = _history_signature(approved)
-    if draft_history and draft_history == approved_history:
-        draft_generic = _generic_signature(draft)
-        approved_generic = _generic_signature(approved)
-        if draft_generic and draft_generic == approved_generic:
+    if draft.history and draft.history == approved.history:
+        if draft.generic and draft.generic == approved.generic:
             return (True, "exact history and generic fields match")
         return (True, "exact history match")
 
-    draft_generic = _generic_signature(draft)
-    approved_generic = _generic_signature(approved)
-    if draft_generic and draft_generic == approved_generic:
+    if draft.generic and draft.generic == approved.generic:
         return (True, "exact generic fields match")
 
     return (False, "")
 
 
-def detect_duplicates_for_item(
-    draft_item: AgenticGroundTruthEntry,
-    approved_items: Sequence[AgenticGroundTruthEntry],
-    max_results: int = 3,
-) -> list[DuplicateWarning]:
-    """Detect duplicate approved items for a single draft item.
-
-    Args:
-        draft_item: The draft item to check
-        approved_items: List of approved items to check against
-        max_results: Maximum number of duplicate warnings to return
+def _items_are_duplicates(
+    draft: AgenticGroundTruthEntry, approved: AgenticGroundTruthEntry
+) -> tuple[bool, str]:
+    """Check if two items are likely duplicates.
 
     Returns:
-        List of DuplicateWarning objects (up to max_results)
+        (is_duplicate, match_reason) tuple
     """
-    warnings: list[DuplicateWarning] = []
+    return _signatures_match(_item_signature(draft), _item_signature(approved))
 
-    for approved in approved_items:
-        # Only check against approved items
-        if approved.status != GroundTruthStatus.approved:
-            continue
 
+class _ApprovedIndex:
+    """Approved items indexed by each normalized signature field.
+
+    Every match rule requires exact equality on a non-empty question, history or
+    generic signature, so a draft only needs to be compared against the approved
+    items sharing at least one of those keys.
+
+    Only the fields detection reads are kept, in parallel lists addressed by
+    position, so the approved models themselves are not retained or touched while
+    drafts are checked.
+    """
+
+    def __init__(self, approved_items: Sequence[AgenticGroundTruthEntry]) -> None:
+        self.ids: list[str] = []
+        self.questions: list[str] = []
+        self.statuses: list[str] = []
+        self.signatures: list[_ItemSignature] = []
+        self._by_question: dict[str, list[int]] = {}
+        self._by_history: dict[str, list[int]] = {}
+        self._by_generic: dict[str, list[int]] = {}
+        for approved in approved_items:
+            # Only check against approved items
+            if approved.status != GroundTruthStatus.approved:
+                continue
+            question = _get_question_text(approved)
+            sig = _item_signature(approved, question)
+            position = len(self.ids)
+            self.ids.append(approved.id)
+            self.questions.append(question)
+            self.statuses.append(approved.status.value)
+            self.signatures.append(sig)
+            for index, key in (
+                (self._by_question, sig.question),
+                (self._by_history, sig.history),
+                (self._by_generic, sig.generic),
+            ):
+                if key:
+                    index.setdefault(key, []).append(position)
+
+    def candidates(self, draft: _ItemSignature) -> list[int]:
+        """Return positions of approved entries sharing a key with the draft, in input order."""
+        positions: set[int] = set()
+        for index, key in (
+            (self._by_question, draft.question),
+            (self._by_history, draft.history),
+            (self._by_generic, draft.generic),
+        ):
+            if key:
+                positions.update(index.get(key, ()))
+        return sorted(positions)
+
+
+def _detect_with_signatures(
+    draft_item: AgenticGroundTruthEntry,
+    approved: _ApprovedIndex,
+    max_results: int,
+) -> list[DuplicateWarning]:
+    # Nothing to compare against: skip normalizing the draft altogether
+    if not approved.ids:
+        return []
+
+    warnings: list[DuplicateWarning] = []
+    draft_sig = _item_signature(draft_item)
+
+    for position in approved.candidates(draft_sig):
         # Don't compare an item to itself
-        if draft_item.id == approved.id:
+        if draft_item.id == approved.ids[position]:
             continue
 
-        is_dup, reason = _items_are_duplicates(draft_item, approved)
+        is_dup, reason = _signatures_match(draft_sig, approved.signatures[position])
         if is_dup:
             warnings.append(
-                DuplicateWarning(
-                    itemId=draft_item.id,
-                    duplicateId=approved.id,
-                    duplicateQuestion=_get_question_text(approved),
-                    duplicateStatus=approved.status.value,
-                    matchReason=reason,
+                # Every value is an internally produced str, so skip validation
+                DuplicateWarning.model_construct(
+                    item_id=draft_item.id,
+                    duplicate_id=approved.ids[position],
+                    duplicate_question=approved.questions[position],
+                    duplicate_status=approved.statuses[position],
+                    match_reason=reason,
                 )
             )
 
@@ -202,6 +259,24 @@ def detect_duplicates_for_item(
     return warnings
 
 
+def detect_duplicates_for_item(
+    draft_item: AgenticGroundTruthEntry,
+    approved_items: Sequence[AgenticGroundTruthEntry],
+    max_results: int = 3,
+) -> list[DuplicateWarning]:
+    """Detect duplicate approved items for a single draft item.
+
+    Args:
+        draft_item: The draft item to check
+        approved_items: List of approved items to check against
+        max_results: Maximum number of duplicate warnings to return
+
+    Returns:
+        List of DuplicateWarning objects (up to max_results)
+    """
+    return _detect_with_signatures(draft_item, _ApprovedIndex(approved_items), max_results)
+
+
 def detect_duplicates_for_bulk_items(
     draft_items: Sequence[AgenticGroundTruthEntry],
     approved_items: Sequence[AgenticGroundTruthEntry],
@@ -220,11 +295,13 @@ def detect_duplicates_for_bulk_items(
         List of DuplicateWarning objects for all draft items
     """
     all_warnings: list[DuplicateWarning] = []
+    # Normalize and index the approved side once; each draft is then a few dict lookups
+    approved = _ApprovedIndex(approved_items)
 
     for draft in draft_items:
         # Only check draft items (don't warn about approved duplicates)
         if draft.status == GroundTruthStatus.draft:
-            warnings = detect_duplicates_for_item(draft, approved_items, max_results_per_item)
+            warnings = _detect_with_signatures(draft, approved, max_results_per_item)
             all_warnings.extend(warnings)
 
     return all_warnings
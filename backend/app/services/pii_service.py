@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Sequence
+from typing import Any, Iterator, NamedTuple, Sequence
 
 from pydantic import BaseModel, Field
 
@@ -57,6 +57,65 @@ PHONE_PATTERN = PIIPattern(
 # All patterns to check (Phase 1)
 PII_PATTERNS: list[PIIPattern] = [EMAIL_PATTERN, PHONE_PATTERN]
 
+# All patterns fused into one alternation of named groups so each field is scanned in a
+# single pass; match.lastgroup identifies which pattern matched. Earlier patterns win
+# where matches would overlap (e.g. digits inside an email address are not a phone).
+_PATTERNS_BY_NAME: dict[str, PIIPattern] = {p.name: p for p in PII_PATTERNS}
+
+# Whether an email can match from some offset of a run of local-part characters does not
+# depend on the offset (the run has to end at "@"), so searching only tries run starts.
+# Without this lookbehind, long runs that never reach a valid "@domain" are rescanned from
+# every offset (quadratic time). The one start it would wrongly skip is the offset where
+# the previous match ended, which _iter_pii_matches tries with the exact pattern instead.
+_EMAIL_LOCAL_CHAR = re.compile(r"[A-Za-z0-9._%+-]", re.IGNORECASE)
+_EMAIL_RUN_START = f"(?<!{_EMAIL_LOCAL_CHAR.pattern})"
+
+
+def _fuse(patterns: Sequence[PIIPattern], *, run_starts_only: bool = False) -> re.Pattern[str]:
+    def source(p: PIIPattern) -> str:
+        if run_starts_only and p is EMAIL_PATTERN:
+            return _EMAIL_RUN_START + p.pattern.pattern
+        return p.pattern.pattern
+
+    return re.compile("|".join(f"(?P<{p.name}>{source(p)})" for p in patterns), re.IGNORECASE)
+
+
+class _ScanPatterns(NamedTuple):
+    search: re.Pattern[str]
+    exact: re.Pattern[str]
+
+
+def _scan_patterns(patterns: Sequence[PIIPattern]) -> _ScanPatterns:
+    return _ScanPatterns(_fuse(patterns, run_starts_only=True), _fuse(patterns))
+
+
+# Cheap prefilter: an email needs an "@" and a phone number needs ASCII digits, so most
+# clean text skips the regex engine entirely, and text with only one of the two runs
+# just that pattern. Keyed by (has "@", has digit).
+_DIGIT_RE = re.compile(r"[0-9]")
+_SCAN_PATTERNS: dict[tuple[bool, bool], _ScanPatterns] = {
+    (True, True): _scan_patterns(PII_PATTERNS),
+    (True, False): _scan_patterns([EMAIL_PATTERN]),
+    (False, True): _scan_patterns([PHONE_PATTERN]),
+}
+
+
+def _iter_pii_matches(text: str, patterns: _ScanPatterns) -> Iterator[re.Match[str]]:
+    """Yield the same leftmost non-overlapping matches as patterns.exact.finditer(text)."""
+    pos = 0
+    while True:
+        match = None
+        if pos and _EMAIL_LOCAL_CHAR.match(text, pos - 1):
+            # The previous match ended inside a run of local-part characters, e.g. the
+            # "-" in "a@b.cc-d@e.ff", so an email may start here despite the lookbehind
+            match = patterns.exact.match(text, pos)
+        if match is None:
+            match = patterns.search.search(text, pos)
+            if match is None:
+                return
+        yield match
+        pos = match.end()
+
 
 def _mask_match(match_text: str, pattern_type: str) -> str:
     """Mask detected PII while preserving context.
@@ -134,28 +193,33 @@ def scan_text_for_pii(text: str, field_name: str, item_id: str) -> list[PIIWarni
     if not text:
         return []
 
+    scan_patterns = _SCAN_PATTERNS.get(("@" in text, _DIGIT_RE.search(text) is not None))
+    if scan_patterns is None:
+        return []
+
     warnings: list[PIIWarning] = []
 
-    for pii_pattern in PII_PATTERNS:
-        for match in pii_pattern.pattern.finditer(text):
-            match_text = match.group(0)
-            masked = _mask_match(match_text, pii_pattern.name)
-            snippet = _create_snippet(
-                text,
-                match.start(),
-                match.end(),
-                masked,
-                pii_pattern.context_chars,
-            )
-            warnings.append(
-                PIIWarning(
-                    item_id=item_id,
-                    field=field_name,
-                    pattern_type=pii_pattern.name,
-                    snippet=snippet,
-                    position=match.start(),
-                )
+    for match in _iter_pii_matches(text, scan_patterns):
+        pii_pattern = _PATTERNS_BY_NAME[match.lastgroup or ""]
+        match_text = match.group(0)
+        masked = _mask_match(match_text, pii_pattern.name)
+        snippet = _create_snippet(
+            text,
+            match.start(),
+            match.end(),
+            masked,
+            pii_pattern.context_chars,
+        )
+        # Every value is produced here with its declared type, so skip validation
+        warnings.append(
+            PIIWarning.model_construct(
+                item_id=item_id,
+                field=field_name,
+                pattern_type=pii_pattern.name,
+                snippet=snippet,
+                position=match.start(),
             )
+        )
 
     return warnings
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Optional, TypedDict, cast
 import logging
 
@@ -45,6 +46,40 @@ class SearchService:
         # Delegate and normalize shape to {url, title}
         assert self.adapter is not None
         raw_results = await self.adapter.query(q=q, top=top)
+        return self._normalize(raw_results)
+
+    async def query_many(
+        self, qs: list[str], top: int = 5, max_concurrency: int | None = None
+    ) -> list[list[SearchResult]]:
+        """Run several queries concurrently and return their results in input order.
+
+        A query whose backend call fails yields an empty list instead of failing the
+        batch. ``max_concurrency`` caps how many requests are in flight at once.
+        """
+        if not self.adapter or not qs:
+            return [[] for _ in qs]
+        adapter = self.adapter
+        limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(q: str) -> list[dict[str, object]]:
+            if limiter is None:
+                return await adapter.query(q=q, top=top)
+            async with limiter:
+                return await adapter.query(q=q, top=top)
+
+        raw_batches = await asyncio.gather(*(run(q) for q in qs), return_exceptions=True)
+        results: list[list[SearchResult]] = []
+        for q, raw in zip(qs, raw_batches):
+            if isinstance(raw, BaseException):
+                if not isinstance(raw, Exception):
+                    raise raw
+                logger.warning("search_service.query_failed", extra={"query": q, "error": str(raw)})
+                results.append([])
+                continue
+            results.append(self._normalize(raw))
+        return results
+
+    def _normalize(self, raw_results: list[dict[str, object]]) -> list[SearchResult]:
         normalized: list[SearchResult] = []
         for r in raw_results:
             # Map provider hit to canonical SearchResult using configurable field names
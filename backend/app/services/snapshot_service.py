@@ -2,16 +2,24 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import json
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi.responses import Response
 
 from app.adapters.repos.base import GroundTruthRepo
 from app.domain.enums import GroundTruthStatus
 from app.domain.models import AgenticGroundTruthEntry
+from app.exports.formatters.json_snapshot_payload import JsonSnapshotPayloadFormatter
 from app.exports.models import ExportFilters, SnapshotExportRequest
 from app.exports.pipeline import ExportPipeline
-from app.exports.registry import ExportFormatterRegistry, ExportProcessorRegistry
+from app.exports.registry import (
+    ExportFormatter,
+    ExportFormatterRegistry,
+    ExportProcessorRegistry,
+)
+
+# Items fetched, dumped and processed together when streaming artifact exports
+_EXPORT_BATCH_SIZE = 500
 
 
 class SnapshotService:
@@ -45,8 +53,11 @@ class SnapshotService:
             { schemaVersion: "v2", snapshotAt, datasetNames, count, filters, items }
         """
         request = SnapshotExportRequest()
-        payload_bytes, _ = await self._format_payload(request)
-        return json.loads(payload_bytes)
+        formatter, items, _ = await self._prepare_formatter(request)
+        if isinstance(formatter, JsonSnapshotPayloadFormatter):
+            # Skip the encode/decode round trip when the stock formatter is configured
+            return formatter.build_payload(items)
+        return json.loads(self._encode(formatter.format(items)))
 
     async def export_snapshot(
         self, request: SnapshotExportRequest
@@ -54,9 +65,10 @@ class SnapshotService:
         delivery_mode = request.delivery.mode if request.delivery else "attachment"
         if delivery_mode == "artifact":
             snapshot_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-            items, filters = await self._collect_export_items(request)
-            return await self.export_pipeline.deliver_artifacts(
-                items=items,
+            # Resolve filters eagerly so an invalid status fails before any file is written
+            status, dataset_names, filters = self._resolve_filters(request)
+            return await self.export_pipeline.deliver_artifact_batches(
+                self._iter_export_batches(request, status, dataset_names),
                 filters=filters,
                 snapshot_at=snapshot_at,
             )
@@ -65,9 +77,9 @@ class SnapshotService:
         filename = self._resolve_filename(request.format, snapshot_at)
         return await self.export_pipeline.deliver_attachment(payload_bytes, filename=filename)
 
-    async def _collect_export_items(
+    def _resolve_filters(
         self, request: SnapshotExportRequest
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    ) -> tuple[GroundTruthStatus | None, list[str] | None, dict[str, Any]]:
         filters = request.filters or ExportFilters()
         status_value = filters.status
         try:
@@ -75,8 +87,18 @@ class SnapshotService:
         except ValueError as exc:
             raise ValueError(f"Invalid status value '{status_value}'") from exc
 
-        items = await self.repo.list_all_gt(status=status)
         dataset_names = filters.dataset_names
+        filters_payload: dict[str, Any] = {"status": status_value}
+        if dataset_names is not None:
+            filters_payload["datasetNames"] = dataset_names
+        return status, dataset_names, filters_payload
+
+    def _process_items(
+        self,
+        request: SnapshotExportRequest,
+        items: list[AgenticGroundTruthEntry],
+        dataset_names: list[str] | None,
+    ) -> list[dict[str, Any]]:
         if dataset_names:
             items = [it for it in items if getattr(it, "datasetName", None) in dataset_names]
 
@@ -87,16 +109,34 @@ class SnapshotService:
         )
         for processor in processors:
             out_items = processor.process(out_items)
-        out_items = self.processor_registry.apply_transforms(
-            out_items, self.plugin_export_transforms
-        )
+        return self.processor_registry.apply_transforms(out_items, self.plugin_export_transforms)
 
-        filters_payload: dict[str, Any] = {"status": status_value}
-        if dataset_names is not None:
-            filters_payload["datasetNames"] = dataset_names
-        return out_items, filters_payload
+    async def _collect_export_items(
+        self, request: SnapshotExportRequest
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        status, dataset_names, filters_payload = self._resolve_filters(request)
+        items = await self.repo.list_all_gt(status=status)
+        return self._process_items(request, items, dataset_names), filters_payload
 
-    async def _format_payload(self, request: SnapshotExportRequest) -> tuple[bytes, str]:
+    async def _iter_export_batches(
+        self,
+        request: SnapshotExportRequest,
+        status: GroundTruthStatus | None,
+        dataset_names: list[str] | None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield processed export documents in bounded batches as the repo streams items."""
+        batch: list[AgenticGroundTruthEntry] = []
+        async for item in self.repo.iter_all_gt(status=status):
+            batch.append(item)
+            if len(batch) >= _EXPORT_BATCH_SIZE:
+                yield self._process_items(request, batch, dataset_names)
+                batch = []
+        if batch:
+            yield self._process_items(request, batch, dataset_names)
+
+    async def _prepare_formatter(
+        self, request: SnapshotExportRequest
+    ) -> tuple[ExportFormatter, list[dict[str, Any]], str]:
         snapshot_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         items, filters = await self._collect_export_items(request)
         format_name = request.format or "json_snapshot_payload"
@@ -105,9 +145,15 @@ class SnapshotService:
             snapshot_at=snapshot_at,
             filters=filters,
         )
-        formatted = formatter.format(items)
-        payload_bytes = formatted if isinstance(formatted, bytes) else formatted.encode("utf-8")
-        return payload_bytes, snapshot_at
+        return formatter, items, snapshot_at
+
+    async def _format_payload(self, request: SnapshotExportRequest) -> tuple[bytes, str]:
+        formatter, items, snapshot_at = await self._prepare_formatter(request)
+        return self._encode(formatter.format(items)), snapshot_at
+
+    @staticmethod
+    def _encode(formatted: bytes | str) -> bytes:
+        return formatted if isinstance(formatted, bytes) else formatted.encode("utf-8")
 
     def _resolve_filename(self, format_name: str | None, snapshot_at: str) -> str:
         if (format_name or "json_snapshot_payload") == "json_items":
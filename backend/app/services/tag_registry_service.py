@@ -13,31 +13,25 @@ class TagsRepo(Protocol):
 class TagRegistryService:
     def __init__(self, repo: TagsRepo):
         self.repo = repo
-
-    @staticmethod
-    def normalize_and_canonicalize(tags: Iterable[str]) -> list[str]:
-        normed: list[str] = []
-        seen: set[str] = set()
-        for t in tags:
-            s = normalize_tag(t)
-            if s not in seen:
-                seen.add(s)
-                normed.append(s)
-        return sorted(normed)
+        # Last stored tag list seen and its normalized, sorted form. The repo is still
+        # read on every call (other instances may have changed the registry); only the
+        # normalize-and-sort pass is skipped when the stored list is unchanged.
+        self._normalized: tuple[tuple[str, ...], list[str]] | None = None
 
     async def list_tags(self) -> list[str]:
-        tags = await self.repo.get_global_tags()
-        # Ensure deterministic sort
-        return sorted([normalize_tag(t) for t in tags])
+        tags = tuple(await self.repo.get_global_tags())
+        if self._normalized is None or self._normalized[0] != tags:
+            # Ensure deterministic sort
+            self._normalized = (tags, sorted([normalize_tag(t) for t in tags]))
+        return list(self._normalized[1])
 
     async def add_tags(self, tags: Iterable[str]) -> list[str]:
-        to_add = self.normalize_and_canonicalize(tags)
-        current = await self.repo.get_global_tags()
-        merged = sorted(set([normalize_tag(t) for t in current]) | set(to_add))
-        return await self.repo.save_global_tags(merged)
+        to_add = {normalize_tag(t) for t in tags}
+        current = {normalize_tag(t) for t in await self.repo.get_global_tags()}
+        return await self.repo.save_global_tags(sorted(current | to_add))
 
     async def remove_tags(self, tags: Iterable[str]) -> list[str]:
-        to_remove = self.normalize_and_canonicalize(tags)
-        current = set(await self.repo.get_global_tags())
-        res = sorted(current - set(to_remove))
-        return await self.repo.save_global_tags(res)
+        to_remove = {normalize_tag(t) for t in tags}
+        # Normalize stored tags too so legacy non-canonical entries can be removed
+        current = {normalize_tag(t) for t in await self.repo.get_global_tags()}
+        return await self.repo.save_global_tags(sorted(current - to_remove))
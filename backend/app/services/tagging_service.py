@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Iterable, Tuple
 
 from app.domain.tags import RULES, TAG_SCHEMA, TagGroupSpec
@@ -13,10 +14,18 @@ import logging
 logger = logging.getLogger(__name__)
 
 _SEP_PATTERN = re.compile(r"\s*:\s*")
+# Already-canonical tags (no whitespace, non-empty group and value) are returned as-is;
+# the canonicalization below would leave them unchanged.
+_CANONICAL_TAG = re.compile(r"[^\s:]+:\S+")
 
 
+# Tags come from a small vocabulary and are normalized repeatedly across bulk imports;
+# invalid tags raise and are therefore never cached.
+@lru_cache(maxsize=8192)
 def normalize_tag(tag: str) -> str:
     s = (tag or "").strip().lower()
+    if _CANONICAL_TAG.fullmatch(s):
+        return s
     s = _SEP_PATTERN.sub(":", s)
     # collapse internal whitespace around group and value
     if ":" not in s:
@@ -57,15 +66,25 @@ def _validate_known(tags: set[str]) -> list[str]:
     return errors
 
 
+@lru_cache(maxsize=4096)
+def _rule_errors(tags: frozenset[str]) -> tuple[tuple[str, ...], ...]:
+    """Run every rule in RULES against a tag set, returning each rule's errors in order.
+
+    RULES and TAG_SCHEMA are fixed at import time, so results depend only on the tag
+    set; bulk imports share a handful of distinct sets across many items.
+    """
+    unique = set(tags)
+    return tuple(tuple(rule.check(unique, TAG_SCHEMA)) for rule in RULES)
+
+
 def validate_tags(tags: Iterable[str]) -> list[str]:
     # normalize, dedupe, sort
-    normalized = [normalize_tag(t) for t in tags]
-    unique: set[str] = set(normalized)
+    unique: set[str] = {normalize_tag(t) for t in tags}
 
     errors = _validate_known(unique)
     # rule checks
-    for rule in RULES:
-        errors.extend(rule.check(unique, TAG_SCHEMA))
+    for rule_errors in _rule_errors(frozenset(unique)):
+        errors.extend(rule_errors)
 
     if errors:
         raise ValueError("; ".join(sorted(set(errors))))
@@ -81,7 +100,8 @@ def upsert_tag(tags: Iterable[str], group: str, value: str) -> list[str]:
     current = [normalize_tag(t) for t in tags]
     if is_exclusive_group(group):
         # remove any existing tag from this group
-        current = [t for t in current if not t.startswith(f"{group}:")]
+        prefix = f"{group}:"
+        current = [t for t in current if not t.startswith(prefix)]
         current.append(tag)
     else:
         # append only if not present
@@ -92,8 +112,9 @@ def upsert_tag(tags: Iterable[str], group: str, value: str) -> list[str]:
 
 
 def remove_group(tags: Iterable[str], group: str) -> list[str]:
-    group = group.strip().lower()
-    remaining = [normalize_tag(t) for t in tags if not normalize_tag(t).startswith(f"{group}:")]
+    prefix = f"{group.strip().lower()}:"
+    # Normalize each tag once; the group prefix only matches the canonical form
+    remaining = [t for t in map(normalize_tag, tags) if not t.startswith(prefix)]
     # remaining must still be valid
     return validate_tags(remaining)
 
@@ -104,8 +125,7 @@ def validate_tags_with_cache(tags: Iterable[str], valid_tags: set[str] | None) -
     if not valid_tags:
         raise ValueError("Valid tags set must be provided for cached validation.")
 
-    normalized = [normalize_tag(t) for t in tags]
-    unique: set[str] = set(normalized)
+    unique: set[str] = {normalize_tag(t) for t in tags}
 
     errors = []
     for tag in unique:
@@ -113,8 +133,8 @@ def validate_tags_with_cache(tags: Iterable[str], valid_tags: set[str] | None) -
             errors.append(f"Unknown tag '{tag}'.")
 
     # Apply existing rules
-    for rule in RULES:
-        errors.extend(rule.check(unique, TAG_SCHEMA))
+    for rule_errors in _rule_errors(frozenset(unique)):
+        errors.extend(rule_errors)
 
     if errors:
         raise ValueError("; ".join(sorted(set(errors))))
@@ -143,9 +163,9 @@ def apply_computed_tags(
 
     # Check for and log any stripped tags (security audit trail)
     # Uses pattern-based matching for dynamic tags (e.g., dataset:*)
-    original_manual_tags = set(item.manual_tags or [])
     cleaned_manual_tags = registry.filter_manual_tags(item.manual_tags, computed_tags)
-    stripped_tags = original_manual_tags - set(cleaned_manual_tags)
+    cleaned_manual_set = frozenset(cleaned_manual_tags)
+    stripped_tags = set(item.manual_tags or ()) - cleaned_manual_set
     if stripped_tags:
         logger.warning(
             f"Stripped computed tag keys from manual tags | "
@@ -157,8 +177,7 @@ def apply_computed_tags(
     item.computed_tags = computed_tags
 
     # Validate exclusive group rules before returning
-    all_tags = set(item.manual_tags) | set(item.computed_tags)
-    for rule in RULES:
-        errors = rule.check(all_tags, TAG_SCHEMA)
-        if errors:
-            raise ValueError("; ".join(errors))
+    all_tags = cleaned_manual_set.union(computed_tags)
+    for rule_errors in _rule_errors(all_tags):
+        if rule_errors:
+            raise ValueError("; ".join(rule_errors))
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from app.domain.conversation_fields import (
@@ -135,11 +134,35 @@ def validate_item_for_approval(item: AgenticGroundTruthEntry, plugin_pack_regist
         raise ApprovalValidationError(errors)
 
 
+def _manual_tags_error(
+    manual_tags: list[str],
+    valid_tags_cache: set[str] | None,
+    tag_error_memo: dict[frozenset[str], str | None] | None,
+) -> str | None:
+    """Return the tag validation error message for manual_tags, or None if they are valid.
+
+    The outcome depends only on the set of raw tags, so bulk validation shares one
+    memo across items and runs normalization and rule checks once per distinct set.
+    """
+    key = frozenset(manual_tags)
+    if tag_error_memo is not None and key in tag_error_memo:
+        return tag_error_memo[key]
+    try:
+        validate_tags_with_cache(manual_tags, valid_tags_cache)
+        error = None
+    except ValueError as e:
+        error = str(e)
+    if tag_error_memo is not None:
+        tag_error_memo[key] = error
+    return error
+
+
 async def validate_ground_truth_item(
     item: AgenticGroundTruthEntry,
     item_index: int,
     valid_tags_cache: set[str] | None = None,
     tag_registry_service=None,
+    tag_error_memo: dict[frozenset[str], str | None] | None = None,
 ) -> list[BulkImportError]:
     """Validate a ground truth item for bulk import.
 
@@ -155,21 +178,21 @@ async def validate_ground_truth_item(
         registry_service = _resolve_tag_registry_service(tag_registry_service)
         if valid_tags_cache is None:
             valid_tags_cache = set(await registry_service.list_tags())
-        try:
-            validate_tags_with_cache(item.manual_tags, valid_tags_cache)
+        tag_error = _manual_tags_error(item.manual_tags, valid_tags_cache, tag_error_memo)
+        if tag_error is None:
             logger.debug(
                 "Tag validation passed | item_id: %s | manualTags: %s",
                 item_id,
                 item.manual_tags,
             )
-        except ValueError as e:
+        else:
             errors.append(
                 BulkImportError(
                     index=item_index,
                     item_id=item_id,
                     field="manualTags",
                     code="INVALID_TAG",
-                    message=str(e),
+                    message=tag_error,
                 )
             )
             logger.warning(
@@ -177,7 +200,7 @@ async def validate_ground_truth_item(
                 item_id,
                 item.datasetName,
                 item.manual_tags,
-                str(e),
+                tag_error,
             )
 
     return errors
@@ -198,26 +221,25 @@ async def validate_bulk_items(
 
     validation_results: dict[int, list[BulkImportError]] = {}
 
-    valid_tags_cache: set[str] | None = None
-    has_items_with_tags = any(item.manual_tags for item in items)
-    if has_items_with_tags:
-        valid_tags_cache = set(
-            await _resolve_tag_registry_service(tag_registry_service).list_tags()
-        )
+    # Only manual tags are validated here, so untagged items can never produce errors
+    tagged = [(index, item) for index, item in enumerate(items) if item.manual_tags]
+    if not tagged:
+        return validation_results
+
+    valid_tags_cache = set(await _resolve_tag_registry_service(tag_registry_service).list_tags())
 
-    validation_tasks = [
-        validate_ground_truth_item(
+    # Items in one import tend to repeat the same few tag combinations
+    tag_error_memo: dict[frozenset[str], str | None] = {}
+    # With the registry pre-fetched, per-item validation never suspends, so await items
+    # one at a time rather than scheduling a task for each of them
+    for index, item in tagged:
+        item_errors = await validate_ground_truth_item(
             item,
             index,
             valid_tags_cache,
             tag_registry_service=tag_registry_service,
+            tag_error_memo=tag_error_memo,
         )
-        for index, item in enumerate(items)
-    ]
-
-    results = await asyncio.gather(*validation_tasks, return_exceptions=False)
-
-    for index, item_errors in enumerate(results):
         if item_errors:
             validation_results[index] = item_errors
 
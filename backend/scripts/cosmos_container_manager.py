@@ -56,15 +56,17 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
 import json
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable
 
 from azure.cosmos import PartitionKey
 from azure.cosmos.aio import CosmosClient
-from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 
 
@@ -148,6 +150,13 @@ def build_partition_key(
 # =============================================================================
 
 
+@lru_cache(maxsize=32)
+def _load_indexing_policy(path: Path) -> dict[str, Any]:
+    """Read and parse an indexing policy file, cached by resolved path."""
+    with open(path) as f:
+        return json.load(f)
+
+
 @dataclass
 class ContainerSpec:
     """Specification for a Cosmos DB container."""
@@ -179,8 +188,8 @@ class ContainerSpec:
         if self.indexing_policy_dict:
             return self.indexing_policy_dict
         if self.indexing_policy_file:
-            with open(self.indexing_policy_file) as f:
-                return json.load(f)
+            # Containers usually share one policy file; parse it once and hand out copies
+            return copy.deepcopy(_load_indexing_policy(Path(self.indexing_policy_file).resolve()))
         return None
 
 
@@ -189,10 +198,15 @@ class ContainerSpec:
 # =============================================================================
 
 
+# Control-plane requests allowed in flight while initializing containers
+DEFAULT_MAX_CONCURRENCY = 8
+
+
 async def create_container(
     client: CosmosClient,
     database_name: str,
     spec: ContainerSpec,
+    database_ready: Awaitable[None] | None = None,
 ) -> dict[str, Any]:
     """
     Create a single container using the Data SDK.
@@ -201,6 +215,8 @@ async def create_container(
         client: CosmosClient instance
         database_name: Name of the database
         spec: Container specification
+        database_ready: Optional awaitable to wait on before creating, when the
+            database may still be being created concurrently
 
     Returns:
         dict with container_name and created status
@@ -208,11 +224,16 @@ async def create_container(
     db = client.get_database_client(database_name)
     container = db.get_container_client(spec.name)
 
+    # Probe first: AAD data-plane roles can usually read container metadata but not
+    # create containers, so reruns against existing containers must not attempt a create
     try:
         await container.read()
         return {"container_name": spec.name, "created": False, "status": "already exists"}
-    except CosmosHttpResponseError:
-        # Container doesn't exist, create it
+    except CosmosResourceNotFoundError:
+        # Container doesn't exist, create it; other errors (auth, throttling) propagate.
+        # A missing database also reads as 404, so wait for it before creating.
+        if database_ready is not None:
+            await database_ready
         partition_key = spec.get_partition_key()
         indexing_policy = spec.get_indexing_policy()
 
@@ -229,37 +250,62 @@ async def create_container(
         return {"container_name": spec.name, "created": True, "status": "created"}
 
 
+async def ensure_database(client: CosmosClient, database_name: str) -> None:
+    """
+    Create the database if it doesn't exist.
+
+    Args:
+        client: CosmosClient instance
+        database_name: Name of the database
+    """
+    db = client.get_database_client(database_name)
+    try:
+        await db.read()
+        print(f"  Database '{database_name}': already exists")
+    except CosmosResourceNotFoundError:
+        # Only a 404 means "create it"; auth and throttling errors surface immediately
+        await client.create_database(database_name)
+        print(f"  Database '{database_name}': created")
+
+
 async def initialize_containers(
     client: CosmosClient,
     database_name: str,
     container_specs: list[ContainerSpec],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
 ) -> dict[str, dict[str, Any]]:
     """
     Initialize multiple containers in a database.
 
     Creates the database if it doesn't exist, then creates each container.
+    Container probes run alongside the database probe; only creating a missing
+    container waits for the database to be ready.
 
     Args:
         client: CosmosClient instance
         database_name: Name of the database
         container_specs: List of container specifications
+        max_concurrency: Maximum number of container requests in flight at once
 
     Returns:
         dict mapping container names to creation results
     """
-    # Create database if not exists
-    db = client.get_database_client(database_name)
-    try:
-        await db.read()
-        print(f"  Database '{database_name}': already exists")
-    except CosmosHttpResponseError:
-        await client.create_database(database_name)
-        print(f"  Database '{database_name}': created")
+    # Usually the database already exists, so don't hold every container on the probe
+    database_ready = asyncio.create_task(ensure_database(client, database_name))
 
-    # Create containers
+    # Create containers concurrently; each is an independent round trip to Cosmos.
+    # The semaphore keeps large bulk configurations from flooding the control plane.
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def create_bounded(spec: ContainerSpec) -> dict[str, Any]:
+        async with semaphore:
+            return await create_container(client, database_name, spec, database_ready)
+
+    _, *created = await asyncio.gather(
+        database_ready, *(create_bounded(spec) for spec in container_specs)
+    )
     results: dict[str, dict[str, Any]] = {}
-    for spec in container_specs:
-        result = await create_container(client, database_name, spec)
+    for spec, result in zip(container_specs, created):
         results[spec.name] = result
         print(f"  Container '{spec.name}': {result['status']}")
 
@@ -429,11 +475,14 @@ def validate_args(args: argparse.Namespace) -> None:
                 "Conflicting options: provide either --partition-key or --partition-paths, not both"
             )
 
+    if args.max_concurrency < 1:
+        errors.append("--max-concurrency must be at least 1")
+
     # Validate file paths
-    if args.containers and not Path(args.containers).exists():
+    if args.containers and not args.containers.exists():
         errors.append(f"Containers file not found: {args.containers}")
 
-    if args.indexing_policy and not Path(args.indexing_policy).exists():
+    if args.indexing_policy and not args.indexing_policy.exists():
         errors.append(f"Indexing policy file not found: {args.indexing_policy}")
 
     if errors:
@@ -455,24 +504,22 @@ async def main_async(args: argparse.Namespace) -> None:
 
     # Build container specs
     if args.containers:
-        container_specs = load_container_specs_from_file(Path(args.containers))
+        container_specs = load_container_specs_from_file(args.containers)
     elif args.container:
         # Custom single container
         paths = args.partition_paths if args.partition_paths else [args.partition_key]
         kind = "MultiHash" if args.partition_paths and len(args.partition_paths) > 1 else "Hash"
-        indexing_file = Path(args.indexing_policy) if args.indexing_policy else None
         container_specs = [
             ContainerSpec(
                 name=args.container,
                 partition_key_paths=paths,
                 partition_key_kind=kind,
-                indexing_policy_file=indexing_file,
+                indexing_policy_file=args.indexing_policy,
                 max_throughput=args.max_throughput,
             )
         ]
     else:
         # Default containers
-        indexing_file = Path(args.indexing_policy) if args.indexing_policy else None
         container_specs = get_default_container_specs(
             gt_container=args.gt_container if args.gt_container else None,
             assignments_container=args.assignments_container
@@ -482,7 +529,7 @@ async def main_async(args: argparse.Namespace) -> None:
             tag_definitions_container=args.tag_definitions_container
             if args.tag_definitions_container
             else None,
-            indexing_policy_file=indexing_file,
+            indexing_policy_file=args.indexing_policy,
             max_throughput=args.max_throughput,
         )
 
@@ -495,7 +542,9 @@ async def main_async(args: argparse.Namespace) -> None:
     )
 
     try:
-        results = await initialize_containers(client, args.db, container_specs)
+        results = await initialize_containers(
+            client, args.db, container_specs, max_concurrency=args.max_concurrency
+        )
     finally:
         await client.close()
 
@@ -601,12 +650,20 @@ Examples:
     bulk_group = parser.add_argument_group("Bulk Configuration")
     bulk_group.add_argument(
         "--containers",
+        type=Path,
         help="Path to JSON file with container configurations",
     )
+    bulk_group.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum containers created in parallel (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
 
     # Indexing policy
     parser.add_argument(
         "--indexing-policy",
+        type=Path,
         help="Path to indexing policy JSON file",
     )
 
@@ -35,6 +35,7 @@ class TestUrlPatternDetection:
         [
             ("https://support.example.com/help/product/page.html", True),
             ("https://SUPPORT.EXAMPLE.COM/help/page.html", True),  # Case insensitive
+            ("https://support.example.com/HELP/page.html", True),  # Case insensitive path
             ("https://docs.example.com/support/article/CS431120", False),
             ("https://example.com/other", False),
         ],
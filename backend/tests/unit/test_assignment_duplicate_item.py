@@ -0,0 +1,50 @@
+"""Unit tests for AssignmentService.duplicate_item."""
+
+from __future__ import annotations
+
+import re
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.repos.memory_repo import InMemoryGroundTruthRepo
+from app.domain.enums import GroundTruthStatus
+from app.services.assignment_service import AssignmentService, _generate_item_id
+from tests.test_helpers import make_test_entry
+
+_NAME_SHAPE = re.compile(r"^[^\s-]+(-[^\s-]+)+$")
+
+
+def test_generate_item_id_is_two_word_hyphenated():
+    ids = {_generate_item_id() for _ in range(50)}
+    assert all(_NAME_SHAPE.match(item_id) for item_id in ids)
+    # Random names should not collapse to a single value
+    assert len(ids) > 1
+
+
+@pytest.mark.anyio
+async def test_duplicate_item_creates_draft_copy_for_user():
+    original = make_test_entry(
+        id="orig-1",
+        dataset_name="ds1",
+        bucket=uuid4(),
+        status=GroundTruthStatus.approved,
+        synth_question="What is X?",
+        answer="X is Y",
+        manual_tags=["topic:x"],
+    )
+    repo = InMemoryGroundTruthRepo(items=[original])
+    svc = AssignmentService(repo)
+
+    copy = await svc.duplicate_item(original, "alice@example.com")
+
+    assert copy.id != original.id
+    assert _NAME_SHAPE.match(copy.id)
+    assert copy.datasetName == original.datasetName
+    assert copy.bucket == original.bucket
+    assert copy.status == GroundTruthStatus.draft
+    assert copy.assignedTo == "alice@example.com"
+    assert copy.manual_tags.count("rephrase:orig-1") == 1
+    assert "topic:x" in copy.manual_tags
+    assert "dataset:ds1" in copy.computed_tags
+    assert "dataset:ds1" not in copy.manual_tags
@@ -0,0 +1,164 @@
+"""Unit tests for AssignmentService.sample_candidates and self_assign."""
+
+from __future__ import annotations
+
+import logging
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.repos.memory_repo import InMemoryGroundTruthRepo
+from app.domain.enums import GroundTruthStatus
+from app.services import assignment_service
+from app.services.assignment_service import AssignmentService
+from tests.test_helpers import make_test_entry
+
+
+def _items(dataset: str, count: int, **kwargs):
+    return [
+        make_test_entry(
+            id=f"{dataset}-{i}",
+            dataset_name=dataset,
+            bucket=uuid4(),
+            synth_question=f"Question {i}?",
+            **kwargs,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def allocation(monkeypatch):
+    """Set the sampling allocation weights seen by the service."""
+
+    def _set(weights: dict[str, float]) -> None:
+        monkeypatch.setattr(assignment_service, "get_sampling_allocation", lambda: dict(weights))
+
+    _set({})
+    return _set
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_without_weights_uses_global_pool(allocation):
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 3) + _items("dsB", 3))
+    svc = AssignmentService(repo)
+
+    result = await svc.sample_candidates("alice", 4)
+
+    assert len(result) == 4
+    assert len({it.id for it in result}) == 4
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_includes_assigned_items_first(allocation):
+    assigned = _items("dsA", 2, status=GroundTruthStatus.draft, assignedTo="alice")
+    repo = InMemoryGroundTruthRepo(items=assigned + _items("dsB", 5))
+    svc = AssignmentService(repo)
+
+    result = await svc.sample_candidates("alice", 4)
+
+    assert {it.id for it in result[:2]} == {"dsA-0", "dsA-1"}
+    assert len(result) == 4
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_weighted_round_robin_respects_quotas(allocation):
+    allocation({"dsA": 0.5, "dsB": 0.5})
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 10) + _items("dsB", 10))
+    svc = AssignmentService(repo)
+
+    result = await svc.sample_candidates("alice", 6)
+
+    datasets = [it.datasetName for it in result]
+    assert datasets.count("dsA") == 3
+    assert datasets.count("dsB") == 3
+    assert len({it.id for it in result}) == 6
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_round_robin_starts_with_heaviest_dataset(allocation):
+    # Weights are deliberately not pre-sorted by the allocation source
+    allocation({"dsA": 0.4, "dsB": 0.6})
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 5) + _items("dsB", 5))
+    svc = AssignmentService(repo)
+
+    result = await svc.sample_candidates("alice", 2)
+
+    assert [it.datasetName for it in result] == ["dsB", "dsA"]
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_fills_from_global_pool_when_dataset_short(allocation):
+    allocation({"dsA": 0.5, "dsB": 0.5})
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 1) + _items("dsB", 1) + _items("dsC", 5))
+    svc = AssignmentService(repo)
+
+    result = await svc.sample_candidates("alice", 5)
+
+    assert len(result) == 5
+    assert len({it.id for it in result}) == 5
+    assert {"dsA-0", "dsB-0"} <= {it.id for it in result}
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_honours_exclude_ids(allocation):
+    allocation({"dsA": 1.0})
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 4))
+    svc = AssignmentService(repo)
+
+    result = await svc.sample_candidates("alice", 4, exclude_ids=["dsA-0", "dsA-1"])
+
+    assert {it.id for it in result} == {"dsA-2", "dsA-3"}
+
+
+@pytest.mark.anyio
+async def test_sample_candidates_accepts_exclude_set_without_mutating_it(allocation):
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 4))
+    svc = AssignmentService(repo)
+    exclude = {"dsA-0", "dsA-1"}
+
+    result = await svc.sample_candidates("alice", 4, exclude_ids=exclude)
+
+    assert {it.id for it in result} == {"dsA-2", "dsA-3"}
+    assert exclude == {"dsA-0", "dsA-1"}
+
+
+@pytest.mark.anyio
+async def test_self_assign_assigns_and_returns_items(allocation):
+    repo = InMemoryGroundTruthRepo(items=_items("dsA", 5))
+    svc = AssignmentService(repo)
+
+    result = await svc.self_assign("alice", 3)
+
+    assert len(result) == 3
+    assert all(it.assignedTo == "alice" for it in result)
+    docs = await repo.list_assignments_by_user("alice")
+    assert {d.ground_truth_id for d in docs} == {it.id for it in result}
+
+
+def test_debug_builds_context_only_when_enabled(caplog):
+    svc = AssignmentService(InMemoryGroundTruthRepo())
+
+    with caplog.at_level(logging.INFO, logger=assignment_service.logger.name):
+        svc._debug("evt.hidden", "item-1", "dsA", count=1)
+    assert not [r for r in caplog.records if r.getMessage() == "evt.hidden"]
+
+    with caplog.at_level(logging.DEBUG, logger=assignment_service.logger.name):
+        svc._debug("evt.shown", "item-1", "dsA", count=1)
+    (record,) = [r for r in caplog.records if r.getMessage() == "evt.shown"]
+    assert (record.item_id, record.dataset, record.count) == ("item-1", "dsA", 1)
+
+
+@pytest.mark.parametrize(
+    "user_id,expected",
+    [
+        ("alice@example.com", True),
+        ("user_1.name-x", True),
+        ("", False),
+        ("alice bob", False),
+        ("alice'; DROP", False),
+        ("alice\n", False),  # "$" would have matched before a trailing newline
+    ],
+)
+def test_validate_user_id(user_id, expected):
+    assert AssignmentService.validate_user_id(user_id) is expected
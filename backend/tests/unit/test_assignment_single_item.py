@@ -0,0 +1,74 @@
+"""Unit tests for AssignmentService.assign_single_item."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.repos.memory_repo import InMemoryGroundTruthRepo
+from app.domain.enums import GroundTruthStatus
+from app.services.assignment_service import AssignmentService
+from tests.test_helpers import make_test_entry
+
+
+@pytest.mark.anyio
+async def test_assign_single_item_returns_written_item_without_refetch():
+    bucket = uuid4()
+    item = make_test_entry(
+        id="item-1",
+        dataset_name="ds1",
+        bucket=bucket,
+        status=GroundTruthStatus.approved,
+        synth_question="Q?",
+    )
+    repo = InMemoryGroundTruthRepo(items=[item])
+    svc = AssignmentService(repo)
+
+    get_calls = 0
+    original_get_gt = repo.get_gt
+
+    async def counting_get_gt(*args, **kwargs):
+        nonlocal get_calls
+        get_calls += 1
+        return await original_get_gt(*args, **kwargs)
+
+    repo.get_gt = counting_get_gt  # type: ignore[method-assign]
+
+    assigned = await svc.assign_single_item("ds1", bucket, "item-1", "alice@example.com")
+
+    # Only the initial existence check reads the item
+    assert get_calls == 1
+    assert assigned.assignedTo == "alice@example.com"
+    assert assigned.status == GroundTruthStatus.draft
+    assert assigned.assigned_at is not None
+    # The returned ETag matches what is stored so the caller can update with If-Match
+    stored = await original_get_gt("ds1", bucket, "item-1")
+    assert stored is not None
+    assert assigned.etag == stored.etag
+    assert await repo.get_assignment_by_gt("alice@example.com", "item-1") is not None
+
+
+@pytest.mark.anyio
+async def test_assign_single_item_raises_when_assignment_rejected():
+    bucket = uuid4()
+    item = make_test_entry(
+        id="item-1",
+        dataset_name="ds1",
+        bucket=bucket,
+        status=GroundTruthStatus.draft,
+        assignedTo="bob@example.com",
+        synth_question="Q?",
+    )
+    repo = InMemoryGroundTruthRepo(items=[item])
+    svc = AssignmentService(repo)
+
+    async def rejecting_assign_to(item_id, user_id):
+        return None
+
+    repo.assign_to = rejecting_assign_to  # type: ignore[method-assign]
+
+    with pytest.raises(ValueError, match="could not be assigned"):
+        await svc.assign_single_item(
+            "ds1", bucket, "item-1", "alice@example.com", force=True, user_roles=["admin"]
+        )
@@ -5,8 +5,9 @@ from __future__ import annotations
 import pytest
 
 from app.domain.models import AgenticGroundTruthEntry
-from app.plugins.base import ComputedTagPlugin, TagPluginRegistry
+from app.plugins.base import ComputedTagPlugin, TagPluginRegistry, memoize_for_evaluation
 from app.plugins.registry import (
+    _discover_plugins,
     get_default_registry,
     reset_default_registry,
 )
@@ -72,6 +73,104 @@ class TestTagPluginRegistry:
         reg2 = get_default_registry()
         assert reg1 is not reg2
 
+    def test_discovery_only_returns_classes_defined_in_plugin_modules(self):
+        """Discovery skips re-imported classes so each plugin is found exactly once."""
+        discovered = _discover_plugins()
+        assert len(discovered) == len(set(discovered))
+        assert all(cls.__module__.startswith("app.plugins.computed_tags.") for cls in discovered)
+
+    def test_default_registry_derives_reference_count_once(self, monkeypatch):
+        """Retrieval-behavior plugins share one reference count derivation per document."""
+        from app.plugins.packs.rag_compat import RagCompatPack
+
+        calls: list[str] = []
+        original = RagCompatPack.reference_count
+
+        def counting_reference_count(self, item):
+            calls.append(item.id)
+            return original(self, item)
+
+        monkeypatch.setattr(RagCompatPack, "reference_count", counting_reference_count)
+        item = AgenticGroundTruthEntry(
+            id="refs", datasetName="test", history=[{"role": "user", "msg": "Q"}]
+        )
+
+        tags = get_default_registry().compute_all(item)
+
+        assert "retrieval_behavior:no_refs" in tags
+        assert calls == ["refs"]
+
+    def test_no_refs_document_skips_reference_url_walk(self, monkeypatch):
+        """Reference-type plugins short-circuit on documents without references."""
+        from app.plugins.base import PluginPackRegistry
+
+        def fail_collect(self, item):
+            raise AssertionError("reference URLs should not be collected for no-refs docs")
+
+        monkeypatch.setattr(PluginPackRegistry, "collect_search_documents", fail_collect)
+        item = AgenticGroundTruthEntry(
+            id="no-refs", datasetName="test", history=[{"role": "user", "msg": "Q"}]
+        )
+
+        tags = get_default_registry().compute_all(item)
+
+        assert "retrieval_behavior:no_refs" in tags
+        assert not any(t.startswith("reference_type:") for t in tags)
+
+    def test_compute_all_batch_matches_per_document_results(self):
+        """Batch computation returns the same tags as compute_all, in input order."""
+        registry = get_default_registry()
+        items = [
+            AgenticGroundTruthEntry(
+                id=f"batch-{i}",
+                datasetName=f"ds-{i}",
+                history=[{"role": "user", "msg": "Q " * (i * 12 + 1)}],
+            )
+            for i in range(3)
+        ]
+
+        assert registry.compute_all_batch(items) == [registry.compute_all(it) for it in items]
+        assert registry.compute_all_batch([]) == []
+
+    def test_memoized_values_are_shared_within_one_evaluation(self):
+        """Plugins sharing a memo key compute the value once per compute_all call."""
+        calls: list[str] = []
+
+        def expensive(doc: AgenticGroundTruthEntry) -> int:
+            calls.append(doc.id)
+            return len(doc.history)
+
+        def make_plugin(key: str, threshold: int) -> ComputedTagPlugin:
+            class _Plugin(ComputedTagPlugin):
+                @property
+                def tag_key(self) -> str:
+                    return key
+
+                def compute(self, doc: AgenticGroundTruthEntry) -> str | None:
+                    count = memoize_for_evaluation(doc, "history_len", lambda: expensive(doc))
+                    return self.tag_key if count >= threshold else None
+
+            return _Plugin()
+
+        registry = TagPluginRegistry()
+        registry.register(make_plugin("len:one", 1))
+        registry.register(make_plugin("len:two", 2))
+        item = AgenticGroundTruthEntry(
+            id="memo", datasetName="test", history=[{"role": "user", "msg": "Q"}]
+        )
+
+        assert registry.compute_all(item) == ["len:one"]
+        assert calls == ["memo"]
+
+        # A new evaluation recomputes (the document may have changed in between)
+        item.history.append(item.history[0])
+        assert registry.compute_all(item) == ["len:one", "len:two"]
+        assert calls == ["memo", "memo"]
+
+        # Outside compute_all the value is computed directly
+        memoize_for_evaluation(item, "history_len", lambda: expensive(item))
+        assert len(calls) == 3
+
 
 class TestDynamicTagPrefixes:
     """Tests for dynamic tag prefix detection and filtering."""
@@ -118,6 +217,12 @@ class TestDynamicTagPrefixes:
         assert registry.get_dynamic_prefixes() == {"dataset:"}
         assert registry.get_static_keys() == {"turns:multiturn"}
 
+        # Returned sets are copies; mutating them must not change filtering
+        registry.get_static_keys().clear()
+        registry.get_dynamic_prefixes().clear()
+        assert registry.is_computed_tag("turns:multiturn") is True
+        assert registry.is_computed_tag("dataset:any") is True
+
     def test_is_computed_tag_static_match(self):
         """is_computed_tag should return True for static tag keys."""
 
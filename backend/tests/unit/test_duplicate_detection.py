@@ -280,6 +280,78 @@ def test_detect_duplicates_for_bulk_items():
     assert warnings[0].duplicate_id == "approved-1"
 
 
+def test_detect_duplicates_for_bulk_items_normalizes_each_item_once(monkeypatch):
+    """Approved items are normalized once per bulk run, not once per draft."""
+    from app.services import duplicate_detection_service as service
+
+    calls: list[str] = []
+    original = service._item_signature
+
+    def counting_signature(item, *args):
+        calls.append(item.id)
+        return original(item, *args)
+
+    monkeypatch.setattr(service, "_item_signature", counting_signature)
+
+    drafts = [
+        make_test_entry(id=f"draft-{i}", synth_question=f"Q{i}", status=GroundTruthStatus.draft)
+        for i in range(3)
+    ]
+    approved = [
+        make_test_entry(id=f"approved-{i}", synth_question="Q0", status=GroundTruthStatus.approved)
+        for i in range(4)
+    ]
+
+    warnings = detect_duplicates_for_bulk_items(drafts, approved, max_results_per_item=10)
+
+    assert len(calls) == len(drafts) + len(approved)
+    assert [w.duplicate_id for w in warnings] == [f"approved-{i}" for i in range(4)]
+
+
+def test_detect_duplicates_skips_draft_normalization_without_approved_items(monkeypatch):
+    """Drafts are not normalized when there are no approved items to compare against."""
+    from app.services import duplicate_detection_service as service
+
+    def failing_signature(item, *args):
+        raise AssertionError("draft signature should not be computed")
+
+    monkeypatch.setattr(service, "_item_signature", failing_signature)
+
+    drafts = [make_test_entry(id="draft", synth_question="Q", status=GroundTruthStatus.draft)]
+    not_approved = [make_test_entry(id="other", synth_question="Q", status=GroundTruthStatus.draft)]
+
+    assert detect_duplicates_for_bulk_items(drafts, []) == []
+    assert detect_duplicates_for_item(drafts[0], not_approved) == []
+
+
+def test_detect_duplicates_for_bulk_items_compares_only_indexed_candidates(monkeypatch):
+    """Drafts are only compared with approved items sharing a normalized key."""
+    from app.services import duplicate_detection_service as service
+
+    calls = 0
+    original = service._signatures_match
+
+    def counting_match(draft, approved):
+        nonlocal calls
+        calls += 1
+        return original(draft, approved)
+
+    monkeypatch.setattr(service, "_signatures_match", counting_match)
+
+    draft = make_test_entry(id="draft", synth_question="Q7", status=GroundTruthStatus.draft)
+    approved = [
+        make_test_entry(
+            id=f"approved-{i}", synth_question=f"Q{i}", status=GroundTruthStatus.approved
+        )
+        for i in range(50)
+    ]
+
+    warnings = detect_duplicates_for_bulk_items([draft], approved)
+
+    assert calls == 1
+    assert [w.duplicate_id for w in warnings] == ["approved-7"]
+
+
 def test_detect_duplicates_for_bulk_items_only_checks_drafts():
     """Test that only draft items are checked for duplicates."""
     items = [
@@ -328,6 +400,21 @@ def test_duplicate_warning_model():
     assert data["matchReason"] == "exact question match"
 
 
+def test_detected_warning_serializes_like_a_validated_model():
+    """Warnings built without validation still round-trip through their aliases."""
+    draft = make_test_entry(id="draft-1", synth_question="Q", status=GroundTruthStatus.draft)
+    approved = make_test_entry(
+        id="approved-1", synth_question="Q", status=GroundTruthStatus.approved
+    )
+
+    [warning] = detect_duplicates_for_item(draft, [approved])
+
+    data = warning.model_dump(by_alias=True)
+    assert DuplicateWarning.model_validate(data).model_dump(by_alias=True) == data
+    assert data["itemId"] == "draft-1"
+    assert data["duplicateId"] == "approved-1"
+
+
 def test_detect_duplicates_uses_edited_question():
     """Test that edited question is used when present."""
     draft = make_test_entry(
@@ -31,3 +31,10 @@ def test_json_snapshot_payload_formatter_builds_envelope() -> None:
     assert payload["filters"]["status"] == "approved"
     assert payload["filters"]["datasetNames"] == ["alpha"]
     assert payload["items"] == docs
+
+
+def test_json_snapshot_payload_build_payload_matches_formatted_json() -> None:
+    docs = [{"id": "1", "datasetName": "alpha"}]
+    formatter = JsonSnapshotPayloadFormatter(snapshot_at="20260116T000000Z")
+
+    assert formatter.build_payload(docs) == json.loads(formatter.format(docs))
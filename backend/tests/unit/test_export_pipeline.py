@@ -34,3 +34,36 @@ async def test_deliver_attachment_sets_content_disposition(tmp_path) -> None:
     response = await pipeline.deliver_attachment(b"{}", filename="snapshot.json")
     assert response.headers.get("Content-Disposition") == 'attachment; filename="snapshot.json"'
     assert response.body == b"{}"
+
+
+@pytest.mark.anyio
+async def test_local_storage_round_trips_bytes_and_lists_keys(tmp_path) -> None:
+    storage = LocalExportStorage(base_dir=tmp_path)
+    await storage.write_bytes("exports/a/one.bin", b"payload", "application/octet-stream")
+    await storage.write_json("exports/a/two.json", {"id": "2"})
+
+    chunks = [chunk async for chunk in await storage.open_read("exports/a/one.bin")]
+
+    assert b"".join(chunks) == b"payload"
+    assert sorted(await storage.list_prefix("exports/a")) == [
+        "exports/a/one.bin",
+        "exports/a/two.json",
+    ]
+
+
+@pytest.mark.anyio
+async def test_local_storage_writes_replace_files_atomically(tmp_path) -> None:
+    storage = LocalExportStorage(base_dir=tmp_path)
+    await storage.write_json("exports/manifest.json", {"count": 1})
+
+    with pytest.raises(TypeError):
+        await storage.write_json("exports/manifest.json", {"count": object()})
+    await storage.write_bytes("exports/data.bin", b"new", "application/octet-stream")
+
+    # A failed write leaves the previous file intact and no temp files behind
+    assert json.loads((tmp_path / "exports" / "manifest.json").read_text()) == {"count": 1}
+    assert (tmp_path / "exports" / "data.bin").read_bytes() == b"new"
+    assert sorted(await storage.list_prefix("exports")) == [
+        "exports/data.bin",
+        "exports/manifest.json",
+    ]
@@ -111,3 +111,17 @@ def test_apply_transforms_runs_in_order() -> None:
     transformed = registry.apply_transforms(docs, transforms)
 
     assert transformed == [{"id": "1", "tags": ["a"], "stage": 2}]
+
+
+def test_apply_transforms_does_not_mutate_input_docs() -> None:
+    registry = ExportProcessorRegistry()
+    docs = [{"id": "1"}]
+
+    def mutate(doc: dict) -> dict:
+        doc["touched"] = True
+        return doc
+
+    transformed = registry.apply_transforms(docs, [mutate])
+
+    assert transformed == [{"id": "1", "touched": True}]
+    assert docs == [{"id": "1"}]
@@ -356,6 +356,61 @@ class TestEdgeCases:
         assert "email" in types
         assert "phone" in types
 
+    def test_mixed_pii_reported_in_text_order(self):
+        """Warnings from a single pass come back in position order."""
+        text = "Call (555) 123-4567 or mail alice@example.com, then 555-987-6543"
+        warnings = scan_text_for_pii(text, "field", "item-1")
+        assert [w.pattern_type for w in warnings] == ["phone", "email", "phone"]
+        assert [w.position for w in warnings] == sorted(w.position for w in warnings)
+
+    def test_digits_inside_email_are_not_a_phone(self):
+        """Overlapping matches are reported once, as the email."""
+        warnings = scan_text_for_pii("Write to 5551234567@example.com", "field", "item-1")
+        assert [w.pattern_type for w in warnings] == ["email"]
+
+    @pytest.mark.parametrize(
+        "text, positions",
+        [
+            ("a@b.cc-d@e.ff", [0, 6]),
+            ("mail a.b@c.io-x.y@z.io", [5, 13]),
+            ("x@y.io.z@w.io", [0, 6]),
+            ("(555) 123-4567.x@y.io", [0, 14]),
+        ],
+    )
+    def test_email_starting_where_previous_match_ends(self, text, positions):
+        """An address joined to the previous match by '-' or '.' is still reported."""
+        warnings = scan_text_for_pii(text, "field", "item-1")
+        assert [w.position for w in warnings] == positions
+
+    def test_long_run_without_at_sign_scans_quickly(self):
+        """A long local-part-like run with no '@' must not be rescanned per offset."""
+        assert scan_text_for_pii("a" * 200_000, "field", "item-1") == []
+
+    def test_adversarial_near_misses_scan_in_linear_time(self):
+        """Inputs that almost match either pattern must not trigger backtracking blowups."""
+        for text in (
+            "a@" + "a" * 100_000,
+            "a@" + "a." * 50_000,
+            "1-" * 50_000,
+            "(5" * 50_000,
+            "1@" * 50_000,
+            "a" * 100_000 + "@x",
+            "a-" * 50_000 + "@x",
+        ):
+            assert scan_text_for_pii(text, "field", "item-1") == []
+
+    def test_joined_addresses_scan_in_linear_time(self):
+        """Matches that end inside a local-part run resume there without rescanning it."""
+        warnings = scan_text_for_pii("a@b.cc-" * 20_000, "field", "item-1")
+        assert len(warnings) == 20_000
+
+    def test_scanned_warning_serializes_like_a_validated_model(self):
+        """Warnings built without validation match a validated round trip."""
+        [warning] = scan_text_for_pii("mail alice@example.com", "comment", "item-1")
+        data = warning.model_dump()
+        assert PIIWarning.model_validate(data).model_dump() == data
+        assert warning.model_fields_set == set(data)
+
     def test_warning_model_serialization(self):
         """PIIWarning should serialize correctly."""
         warning = PIIWarning(
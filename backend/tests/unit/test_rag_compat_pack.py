@@ -207,6 +207,24 @@ def test_detach_reference_removes_by_url():
     assert pack.refs_from_item(item) == []
 
 
+def test_detach_references_removes_all_listed_urls_in_one_pass():
+    pack = RagCompatPack()
+    item = _generic_item()
+    for url in (
+        "https://docs.example.com/a",
+        "https://docs.example.com/b",
+        "https://docs.example.com/c",
+    ):
+        pack.attach_reference(item, Reference(url=url))
+
+    result = pack.detach_references(
+        item, ["https://docs.example.com/a", "https://docs.example.com/c", "https://missing"]
+    )
+
+    assert result is item
+    assert [ref.url for ref in pack.refs_from_item(item)] == ["https://docs.example.com/b"]
+
+
 def test_replace_references_clears_legacy_fields():
     pack = RagCompatPack()
     item = AgenticGroundTruthEntry.model_validate(
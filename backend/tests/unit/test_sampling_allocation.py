@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from app.core import config
 from app.core.config import parse_sampling_allocation_env, normalize_allocation
 from app.services.assignment_service import AssignmentService
 
@@ -36,3 +37,17 @@ def test_compute_quotas_handles_empty_or_zero_weights():
     assert AssignmentService.compute_quotas({}, 5) == {}
     q = AssignmentService.compute_quotas({"a": 0.0, "b": -1.0}, 7)
     assert q == {"a": 0, "b": 0}
+
+
+def test_get_sampling_allocation_orders_by_weight_and_tracks_setting(monkeypatch):
+    monkeypatch.setattr(config.settings, "SAMPLING_ALLOCATION", "dsA:20,dsB:50,dsC:30")
+    got = config.get_sampling_allocation()
+    assert list(got) == ["dsB", "dsC", "dsA"]
+    assert got["dsB"] == pytest.approx(0.5)
+
+    # Returned dicts are independent copies of the cached parse
+    got["dsB"] = 0.0
+    assert config.get_sampling_allocation()["dsB"] == pytest.approx(0.5)
+
+    monkeypatch.setattr(config.settings, "SAMPLING_ALLOCATION", "dsX:1")
+    assert config.get_sampling_allocation() == {"dsX": 1.0}
@@ -6,11 +6,12 @@ in the ``raw_payload`` field alongside the normalized url/title/chunk.
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from app.services.search_service import SearchService
 
-
 # ---------------------------------------------------------------------------
 # Fake adapter
 # ---------------------------------------------------------------------------
@@ -116,3 +117,49 @@ async def test_configurable_field_names_with_raw_payload():
     assert results[0]["chunk"] == "Chunk text"
     assert results[0]["raw_payload"]["relevance"] == 0.88
     assert results[0]["raw_payload"]["document_url"] == "https://example.com"
+
+
+class _PerQueryAdapter:
+    """Answers each query after a short delay, failing on the query 'boom'."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query(self, q: str, top: int = 5) -> list[dict]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if q == "boom":
+                raise RuntimeError("backend down")
+            return [{"url": f"https://example.com/{q}", "title": q, "chunk": q}]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.anyio
+async def test_query_many_runs_concurrently_in_order_and_isolates_failures():
+    adapter = _PerQueryAdapter()
+    service = SearchService(adapter=adapter)
+
+    results = await service.query_many(["a", "boom", "b"])
+
+    assert [[r["title"] for r in hits] for hits in results] == [["a"], [], ["b"]]
+    assert adapter.max_in_flight == 3
+
+
+@pytest.mark.anyio
+async def test_query_many_respects_max_concurrency():
+    adapter = _PerQueryAdapter()
+    service = SearchService(adapter=adapter)
+
+    results = await service.query_many(["a", "b", "c", "d"], max_concurrency=2)
+
+    assert len(results) == 4
+    assert adapter.max_in_flight == 2
+
+
+@pytest.mark.anyio
+async def test_query_many_without_adapter_returns_empty_lists():
+    assert await SearchService().query_many(["a", "b"]) == [[], []]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 from typing import Any
 
@@ -9,6 +11,8 @@ from app.exports.pipeline import ExportPipeline
 from app.exports.processors.merge_tags import MergeTagsProcessor
 from app.exports.registry import ExportFormatterRegistry, ExportProcessorRegistry
 from app.exports.storage.local import LocalExportStorage
+from app.exports.models import ExportFilters, SnapshotExportRequest
+from app.services import snapshot_service
 from app.services.snapshot_service import SnapshotService
 from app.domain.models import AgenticGroundTruthEntry
 from app.domain.enums import GroundTruthStatus
@@ -26,6 +30,12 @@ class _FakeRepo:
             return list(self._items)
         return [it for it in self._items if it.status == status]
 
+    async def iter_all_gt(self, status=None):  # type: ignore[override]
+        self.calls.append(("iter_all_gt", status))
+        for it in self._items:
+            if status is None or it.status == status:
+                yield it
+
     # Stubs to satisfy GroundTruthRepo protocol for type checkers in tests
     async def import_bulk_gt(self, *args, **kwargs):  # pragma: no cover
         raise NotImplementedError
@@ -245,3 +255,50 @@ async def test_build_snapshot_payload_applies_plugin_export_transforms():
     payload = await svc.build_snapshot_payload()
 
     assert payload["items"][0]["pluginProjected"] is True
+
+
+@pytest.mark.anyio
+async def test_export_snapshot_artifacts_streams_items_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot_service, "_EXPORT_BATCH_SIZE", 2)
+    items = [_make_item(str(i), f"ds{i % 2}", GroundTruthStatus.approved) for i in range(5)]
+    items.append(_make_item("draft", "ds9", GroundTruthStatus.draft))
+    repo = _FakeRepo(items)
+    processor_registry = ExportProcessorRegistry()
+    processor_registry.register(MergeTagsProcessor())
+    svc = SnapshotService(
+        repo,
+        export_pipeline=ExportPipeline(LocalExportStorage(base_dir=tmp_path)),
+        processor_registry=processor_registry,
+        formatter_registry=ExportFormatterRegistry(),
+        default_processor_order=["merge_tags"],
+    )
+
+    result = await svc.export_snapshot(SnapshotExportRequest())
+
+    assert isinstance(result, dict)
+    assert result["count"] == 5
+    assert repo.calls == [("iter_all_gt", GroundTruthStatus.approved)]
+    manifest = json.loads((tmp_path / str(result["manifestPath"])).read_text())
+    assert manifest["datasetNames"] == ["ds0", "ds1"]
+    written = json.loads(
+        (tmp_path / str(result["snapshotDir"]) / "ground-truth-4.json").read_text()
+    )
+    assert written["tags"] == []
+
+
+@pytest.mark.anyio
+async def test_export_snapshot_artifacts_rejects_invalid_status_before_writing(tmp_path):
+    repo = _FakeRepo([_make_item("1", "ds", GroundTruthStatus.approved)])
+    svc = SnapshotService(
+        repo,
+        export_pipeline=ExportPipeline(LocalExportStorage(base_dir=tmp_path)),
+        processor_registry=ExportProcessorRegistry(),
+        formatter_registry=ExportFormatterRegistry(),
+        default_processor_order=[],
+    )
+
+    with pytest.raises(ValueError, match="Invalid status"):
+        await svc.export_snapshot(SnapshotExportRequest(filters=ExportFilters(status="bogus")))
+
+    assert repo.calls == []
+    assert not (tmp_path / "exports").exists()
@@ -88,3 +88,38 @@ async def test_invalid_format_rejected_by_service():
     svc = TagRegistryService(repo)
     with pytest.raises(Exception):
         await svc.add_tags(["invalid-tag-without-colon"])
+
+
+@pytest.mark.anyio
+async def test_remove_matches_non_canonical_stored_tags():
+    repo = InMemoryTagsRepo()
+    repo.tags = [" Topic : Science ", "source:sme"]
+    svc = TagRegistryService(repo)
+    res = await svc.remove_tags(["topic:science"])
+    assert res == ["source:sme"]
+
+
+@pytest.mark.anyio
+async def test_list_tags_reuses_normalized_list_until_registry_changes(monkeypatch):
+    from app.services import tag_registry_service
+
+    calls: list[str] = []
+
+    def counting_normalize(tag: str) -> str:
+        calls.append(tag)
+        return tag.strip().lower()
+
+    monkeypatch.setattr(tag_registry_service, "normalize_tag", counting_normalize)
+    repo = InMemoryTagsRepo()
+    repo.tags = ["topic:b", "Topic:A"]
+    svc = TagRegistryService(repo)
+
+    first = await svc.list_tags()
+    first.append("mutated:by-caller")
+    assert await svc.list_tags() == ["topic:a", "topic:b"]
+    assert len(calls) == 2
+
+    # A change made elsewhere (e.g. another instance) is picked up on the next read
+    repo.tags = ["topic:c"]
+    assert await svc.list_tags() == ["topic:c"]
+    assert len(calls) == 3
@@ -3,6 +3,8 @@ import pytest
 from app.services.tagging_service import (
     normalize_tag,
     parse_tag,
+    remove_group,
+    upsert_tag,
     validate_tags,
 )
 from app.domain.tags import TAG_SCHEMA
@@ -12,6 +14,27 @@ def test_normalize_tag_trims_and_lowercases():
     assert normalize_tag("  Source : SME  ") == "source:sme"
 
 
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("source:sme", "source:sme"),
+        ("Topic:Simulation", "topic:simulation"),
+        ("group:value:with:colons", "group:value:with:colons"),
+        ("multi word : value", "multi word:value"),
+        ("group:two  spaces", "group:two spaces"),
+        ("group:\tvalue", "group:value"),
+    ],
+)
+def test_normalize_tag_canonical_and_slow_paths_agree(raw: str, expected: str):
+    assert normalize_tag(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [":value", "group:", " : ", "nocolon"])
+def test_normalize_tag_rejects_empty_parts(raw: str):
+    with pytest.raises(ValueError):
+        normalize_tag(raw)
+
+
 def test_parse_tag_rejects_malformed():
     with pytest.raises(ValueError):
         parse_tag("no-sep")
@@ -52,3 +75,62 @@ def test_schema_registry_exposes_expected_groups():
 def test_rules_are_applied_in_validation():
     with pytest.raises(ValueError):
         validate_tags(["source:sme", "source:other"])  # exclusivity rule
+
+
+def test_normalize_tag_caches_results_but_not_errors():
+    normalize_tag.cache_clear()
+    assert normalize_tag("Cache : Hit") == "cache:hit"
+    assert normalize_tag("Cache : Hit") == "cache:hit"
+    assert normalize_tag.cache_info().hits == 1
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            normalize_tag("no-separator")
+    assert normalize_tag.cache_info().currsize == 1
+
+
+def test_rule_checks_are_shared_across_equal_tag_sets():
+    from app.services.tagging_service import _rule_errors
+
+    _rule_errors.cache_clear()
+    for _ in range(3):
+        with pytest.raises(ValueError, match="Group 'source' is exclusive"):
+            validate_tags(["source:sme", "source:synthetic"])
+        assert validate_tags(["topic:general", "source:sme"]) == ["source:sme", "topic:general"]
+
+    info = _rule_errors.cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+def test_remove_group_matches_non_canonical_tags():
+    assert remove_group(["Source : SME", "topic:general", "source:user"], " Source ") == [
+        "topic:general"
+    ]
+
+
+def test_upsert_tag_replaces_member_of_exclusive_group():
+    assert upsert_tag(["Source : SME", "topic:general"], "source", "synthetic") == [
+        "source:synthetic",
+        "topic:general",
+    ]
+
+
+def test_rules_report_exclusivity_and_dependency_violations():
+    from app.domain.tags import DependencyRule, ExclusiveGroupRule, TagGroupSpec
+
+    schema = {
+        "source": TagGroupSpec(name="source", values={"sme", "user"}, exclusive=True),
+        "review": TagGroupSpec(
+            name="review", values={"done"}, exclusive=False, depends_on=[("source", "sme")]
+        ),
+    }
+
+    assert ExclusiveGroupRule().check({"source:sme", "review:done"}, schema) == []
+    assert ExclusiveGroupRule().check({"source:sme", "source:user"}, schema) == [
+        "Group 'source' is exclusive; only one value allowed, got: ['sme', 'user']"
+    ]
+    assert DependencyRule().check({"source:sme", "review:done"}, schema) == []
+    assert DependencyRule().check({"source:user", "review:done"}, schema) == [
+        "Tag group 'review' requires 'source:sme' to be present"
+    ]
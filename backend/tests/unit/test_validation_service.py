@@ -1,3 +1,5 @@
+import pytest
+
 from app.domain.models import (
     AgenticGroundTruthEntry,
     ExpectedTools,
@@ -5,6 +7,7 @@ from app.domain.models import (
     ToolExpectation,
 )
 from app.services.validation_service import collect_approval_validation_errors
+from tests.test_helpers import make_test_entry
 
 
 def test_approval_validation_accepts_legacy_question_answer_payload():
@@ -102,3 +105,68 @@ def test_approval_validation_requires_required_tool_to_match_tool_calls():
     errors = collect_approval_validation_errors(item)
 
     assert errors == ["expectedTools.required references toolCalls that do not exist: browser"]
+
+
+@pytest.mark.anyio
+async def test_validate_bulk_items_checks_each_distinct_tag_set_once(monkeypatch):
+    from app.services import validation_service
+
+    calls: list[list[str]] = []
+    original = validation_service.validate_tags_with_cache
+
+    def counting_validate(tags, valid_tags):
+        calls.append(list(tags))
+        return original(tags, valid_tags)
+
+    monkeypatch.setattr(validation_service, "validate_tags_with_cache", counting_validate)
+
+    class _Registry:
+        async def list_tags(self) -> list[str]:
+            return ["source:sme", "topic:general"]
+
+    items = [
+        make_test_entry(id=f"ok-{i}", manual_tags=["source:sme", "topic:general"]) for i in range(4)
+    ] + [make_test_entry(id=f"bad-{i}", manual_tags=["topic:unknown"]) for i in range(3)]
+
+    results = await validation_service.validate_bulk_items(items, tag_registry_service=_Registry())
+
+    assert len(calls) == 2
+    assert sorted(results) == [4, 5, 6]
+    assert all(errs[0].code == "INVALID_TAG" for errs in results.values())
+    assert {errs[0].item_id for errs in results.values()} == {"bad-0", "bad-1", "bad-2"}
+
+
+@pytest.mark.anyio
+async def test_validate_bulk_items_skips_registry_and_validation_without_manual_tags():
+    from app.services import validation_service
+
+    class _FailingRegistry:
+        async def list_tags(self) -> list[str]:
+            raise AssertionError("tag registry should not be queried")
+
+    items = [make_test_entry(id=f"item-{i}") for i in range(3)]
+
+    assert (
+        await validation_service.validate_bulk_items(items, tag_registry_service=_FailingRegistry())
+        == {}
+    )
+
+
+@pytest.mark.anyio
+async def test_validate_bulk_items_keys_errors_by_original_position():
+    from app.services import validation_service
+
+    class _Registry:
+        async def list_tags(self) -> list[str]:
+            return ["source:sme"]
+
+    items = [
+        make_test_entry(id="untagged"),
+        make_test_entry(id="bad", manual_tags=["topic:unknown"]),
+        make_test_entry(id="ok", manual_tags=["source:sme"]),
+    ]
+
+    results = await validation_service.validate_bulk_items(items, tag_registry_service=_Registry())
+
+    assert list(results) == [1]
+    assert results[1][0].index == 1